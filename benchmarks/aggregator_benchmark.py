@@ -0,0 +1,43 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Shows that SBOMAggregator scales linearly with the number of packages.
+#
+# Usage: PYTHONPATH=. python benchmarks/aggregator_benchmark.py [max_packages]
+
+import sys
+import time
+
+from lib4sbom.license import LicenseScanner
+from synthetic import synthetic_packages
+
+from sbom2doc.aggregator import SBOMAggregator
+
+
+def run(count, license_info):
+    packages = list(synthetic_packages(count))
+    start = time.perf_counter()
+    summary = SBOMAggregator(license_info)
+    for package in packages:
+        summary.add_package(package)
+    summary.component_summary()
+    summary.license_summary()
+    summary.supplier_summary()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    argv = argv or sys.argv
+    max_packages = int(argv[1]) if len(argv) > 1 else 1000000
+    license_info = LicenseScanner()
+    print(f"{'Packages':>10} {'Time (s)':>10} {'us/package':>12}")
+    count = 1000
+    while count <= max_packages:
+        elapsed = run(count, license_info)
+        print(f"{count:>10} {elapsed:>10.3f} {elapsed * 1e6 / count:>12.2f}")
+        count *= 10
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Measures the time and peak memory of generate_document for every format
+# using synthetic SBOMs of increasing size. Each document is generated in a
+# fresh interpreter so that the peak memory of each format is measured
+# independently. Fails if the time or memory regresses against the baseline.
+#
+# Usage: PYTHONPATH=. python benchmarks/format_benchmark.py [--save]
+#            [--scales 1000,10000]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from synthetic import write_sbom
+
+from sbom2doc.docbuilder.registry import get_formats
+
+BASELINE = os.path.join(os.path.dirname(__file__), "format_baseline.json")
+
+SCALES = [1000, 10000, 100000]
+
+SCRIPT = """
+import json, sys, time
+from lib4sbom.parser import SBOMParser
+from sbom2doc.generator import generate_document
+from sbom2doc.licensecache import LicenseCache
+from sbom2doc.profiler import Profiler, peak_memory
+sbom_file, format, outfile, high_volume = sys.argv[1:5]
+parser = SBOMParser()
+parser.parse_file(sbom_file)
+parsed_memory = peak_memory()
+start = time.perf_counter()
+generate_document(
+    format,
+    parser,
+    sbom_file,
+    outfile,
+    False,
+    license_cache=LicenseCache(enabled=False),
+    high_volume=high_volume == "1",
+    profiler=Profiler(),
+)
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, parsed_memory, peak_memory()]), file=sys.stderr)
+"""
+
+
+def measure(sbom_file, format, directory, high_volume, runs, timeout):
+    # Returns None if the document is not generated within the timeout
+    times = []
+    memory = []
+    outfile = "" if format == "console" else os.path.join(directory, "output")
+    for _ in range(runs):
+        try:
+            result = subprocess.run(
+                [sys.executable, "-c", SCRIPT, sbom_file, format, outfile]
+                + ["1" if high_volume else "0"],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                env=dict(os.environ, SBOM2DOC_CACHE_DIR=directory),
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return None
+        elapsed, parsed_memory, peak = json.loads(result.stderr.splitlines()[-1])
+        times.append(elapsed)
+        # Memory used to generate the document in addition to the parsed SBOM
+        if peak is not None:
+            memory.append(peak - parsed_memory)
+    size = os.path.getsize(outfile) if outfile != "" else 0
+    return (
+        round(statistics.median(times), 3),
+        max(memory) if len(memory) > 0 else None,
+        size,
+    )
+
+
+def regression(value, expected, tolerance):
+    return (
+        value is not None
+        and expected is not None
+        and value > expected * (1 + tolerance)
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="sbom2doc format benchmark")
+    parser.add_argument(
+        "--scales",
+        default=",".join(str(scale) for scale in SCALES),
+        help="comma separated list of package counts",
+    )
+    parser.add_argument(
+        "--formats",
+        default=",".join(get_formats(plugins=False)),
+        help="comma separated list of formats (default: all)",
+    )
+    parser.add_argument("-t", "--type", choices=["spdx", "cyclonedx"], default="spdx")
+    parser.add_argument(
+        "--files", type=float, default=0.1, help="files per package (default: 0.1)"
+    )
+    parser.add_argument(
+        "--relationships",
+        type=float,
+        default=2.0,
+        help="relationships per package (default: 2)",
+    )
+    parser.add_argument("--licenses", type=int, default=20)
+    parser.add_argument(
+        "--vulnerabilities",
+        type=float,
+        default=0.01,
+        help="vulnerabilities per package, cyclonedx only (default: 0.01)",
+    )
+    parser.add_argument("--high-volume", action="store_true")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=300,
+        help="maximum time to generate a document in seconds (default: 300)",
+    )
+    parser.add_argument("--save", action="store_true", help="save as baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown relative to the baseline (default: 0.25 = 25%%)",
+    )
+    parser.add_argument(
+        "--memory-tolerance",
+        type=float,
+        default=0.25,
+        help="allowed memory increase relative to the baseline (default: 0.25)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    failed = False
+    results = dict(baseline) if args.save else {}
+    print(
+        f"{'Format':<14} {'Packages':>9} {'Time (s)':>9} {'Baseline':>9} "
+        f"{'Memory (KB)':>12} {'Baseline':>9} {'Size (KB)':>10}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in [int(scale) for scale in args.scales.split(",")]:
+            extension = "spdx" if args.type == "spdx" else "json"
+            sbom_file = os.path.join(directory, f"sbom-{scale}.{extension}")
+            write_sbom(
+                sbom_file,
+                args.type,
+                scale,
+                int(scale * args.files),
+                int(scale * args.relationships),
+                args.licenses,
+                int(scale * args.vulnerabilities),
+            )
+            for format in args.formats.split(","):
+                key = f"{args.type}:{format}:{scale}"
+                if args.high_volume:
+                    key += ":high-volume"
+                expected = baseline.get(key, {})
+                result = measure(
+                    sbom_file,
+                    format,
+                    directory,
+                    args.high_volume,
+                    args.runs,
+                    args.timeout,
+                )
+                if result is None:
+                    # Only a regression if previously completed
+                    failed = failed or expected.get("time") is not None
+                    results[key] = {"time": None, "memory_kb": None}
+                    print(f"{format:<14} {scale:>9} {'TIMEOUT':>9}", flush=True)
+                    continue
+                elapsed, memory, size = result
+                status = ""
+                if regression(elapsed, expected.get("time"), args.tolerance):
+                    status = "TIME REGRESSION"
+                    failed = True
+                if regression(memory, expected.get("memory_kb"), args.memory_tolerance):
+                    status = (status + " MEMORY REGRESSION").strip()
+                    failed = True
+                results[key] = {"time": elapsed, "memory_kb": memory}
+                print(
+                    f"{format:<14} {scale:>9} {elapsed:>9} "
+                    f"{str(expected.get('time', '-')):>9} {str(memory):>12} "
+                    f"{str(expected.get('memory_kb', '-')):>9} "
+                    f"{size // 1024:>10} {status}",
+                    flush=True,
+                )
+
+    if args.save:
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Shows that the dependency graph analysis scales linearly with the number
+# of relationships.
+#
+# Usage: PYTHONPATH=. python benchmarks/graph_benchmark.py [max_packages]
+
+import sys
+import time
+
+from synthetic import synthetic_packages, synthetic_relationships
+
+from sbom2doc.graph import DependencyGraph
+
+
+def run(count):
+    packages = list(synthetic_packages(count))
+    relationships = list(synthetic_relationships(count))
+    start = time.perf_counter()
+    graph = DependencyGraph(packages, relationships)
+    graph.depth_summary()
+    graph.most_dependents()
+    return time.perf_counter() - start, len(relationships), graph
+
+
+def main(argv=None):
+    argv = argv or sys.argv
+    max_packages = int(argv[1]) if len(argv) > 1 else 100000
+    print(
+        f"{'Packages':>10} {'Edges':>10} {'Time (s)':>10} {'us/edge':>10} "
+        f"{'Depth':>6} {'Cycles':>7}"
+    )
+    count = 1000
+    while count <= max_packages:
+        elapsed, edges, graph = run(count)
+        print(
+            f"{count:>10} {edges:>10} {elapsed:>10.3f} "
+            f"{elapsed * 1e6 / edges:>10.2f} {graph.max_depth():>6} "
+            f"{len(graph.cycles):>7}"
+        )
+        count *= 10
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
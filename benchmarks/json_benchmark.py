@@ -0,0 +1,70 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Output size and time taken to write the package table as JSON, columnar
+# JSON and NDJSON using each of the available serializer backends.
+#
+# Usage: PYTHONPATH=. python benchmarks/json_benchmark.py [packages]
+
+import os
+import sys
+import tempfile
+import time
+
+from lib4sbom.license import LicenseScanner
+from synthetic import synthetic_packages
+
+from sbom2doc.aggregator import SBOMAggregator
+from sbom2doc.docbuilder.columnarbuilder import ColumnarJSONBuilder
+from sbom2doc.docbuilder.jsonbuilder import JSONBuilder
+from sbom2doc.docbuilder.ndjsonbuilder import NDJSONBuilder
+from sbom2doc.docbuilder.serializer import BACKENDS
+
+HEADER = [
+    "Name",
+    "Version",
+    "PURL",
+    "CPE",
+    "Type",
+    "Supplier",
+    "License",
+    "Ecosystem",
+    "Download",
+    "Copyright",
+]
+
+
+def run(builder, rows, filename):
+    start = time.perf_counter()
+    builder.heading(1, "Package Summary")
+    builder.createtable(HEADER)
+    for row in rows:
+        builder.addrow(row)
+    builder.showtable()
+    builder.publish(filename)
+    return time.perf_counter() - start, os.path.getsize(filename)
+
+
+def main(argv=None):
+    argv = argv or sys.argv
+    count = int(argv[1]) if len(argv) > 1 else 100000
+    summary = SBOMAggregator(LicenseScanner())
+    rows = [summary.add_package(p).row() for p in synthetic_packages(count)]
+    builders = [("json", lambda: JSONBuilder())]
+    for backend in BACKENDS:
+        builders.append(
+            (f"json-columnar ({backend})", lambda b=backend: ColumnarJSONBuilder(b))
+        )
+        builders.append((f"ndjson ({backend})", lambda b=backend: NDJSONBuilder(b)))
+    print(f"{count} packages")
+    print(f"{'Format':<24} {'Time (s)':>10} {'Size (MB)':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "document")
+        for name, builder in builders:
+            elapsed, size = run(builder(), rows, filename)
+            print(f"{name:<24} {elapsed:>10.3f} {size / 1e6:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
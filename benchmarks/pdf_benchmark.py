@@ -0,0 +1,70 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Time taken to generate the package table of a PDF document for an
+# increasing number of packages, with and without high volume mode.
+#
+# Usage: PYTHONPATH=. python benchmarks/pdf_benchmark.py [max_packages] [max_standard]
+
+import os
+import sys
+import tempfile
+import time
+
+from lib4sbom.license import LicenseScanner
+from synthetic import synthetic_packages
+
+from sbom2doc.aggregator import SBOMAggregator
+from sbom2doc.docbuilder.pdfbuilder import PDFBuilder
+
+HEADER = [
+    "Name",
+    "Version",
+    "PURL",
+    "CPE",
+    "Type",
+    "Supplier",
+    "License",
+    "Ecosystem",
+    "Download",
+    "Copyright",
+]
+
+
+def run(count, high_volume, license_info, filename):
+    summary = SBOMAggregator(license_info)
+    rows = [summary.add_package(p).row() for p in synthetic_packages(count)]
+    start = time.perf_counter()
+    builder = PDFBuilder()
+    builder.set_high_volume(high_volume)
+    builder.heading(1, "Package Summary")
+    builder.createtable(HEADER, [12, 8, 8, 8, 12])
+    for row in rows:
+        builder.addrow(row)
+    builder.showtable(widths=[5, 2, 2, 5])
+    builder.publish(filename)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    argv = argv or sys.argv
+    max_packages = int(argv[1]) if len(argv) > 1 else 20000
+    # Standard mode is super-linear so is limited to smaller documents
+    max_standard = int(argv[2]) if len(argv) > 2 else 5000
+    license_info = LicenseScanner()
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "benchmark.pdf")
+        print(f"{'Packages':>10} {'Standard (s)':>14} {'High volume (s)':>16}")
+        for count in [1000, 2000, 5000, 10000, 20000, 50000, 100000]:
+            if count > max_packages:
+                break
+            standard = "-"
+            if count <= max_standard:
+                standard = f"{run(count, False, license_info, filename):.2f}"
+            high_volume = run(count, True, license_info, filename)
+            print(f"{count:>10} {standard:>14} {high_volume:>16.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Compares the memory used and throughput of the package records retained
+# by the report with the previous approach of parsing every PURL and
+# holding each row as a list. The records are only converted to rows as
+# the report is rendered.
+#
+# Usage: PYTHONPATH=. python benchmarks/records_benchmark.py [packages] [distinct]
+
+import sys
+import time
+import tracemalloc
+
+from lib4sbom.license import LicenseScanner
+from packageurl import PackageURL
+from synthetic import synthetic_packages
+
+from sbom2doc.aggregator import SBOMAggregator
+from sbom2doc.report import Report
+
+
+def previous_row(package, license_info):
+    license = package.get("licenseconcluded", "NOT KNOWN")
+    if license != "NOT KNOWN" and license_info.deprecated(license):
+        license = f"{license} (Deprecated)"
+    ecosystem = "-"
+    purl = cpe = ""
+    for reference in package.get("externalreference", []):
+        if reference[1] == "purl":
+            try:
+                ecosystem = PackageURL.from_string(reference[2]).to_dict()["type"]
+            except ValueError:
+                ecosystem = "INVALID"
+            purl = reference[2]
+        elif reference[1] in ["cpe22Type", "cpe23Type"]:
+            cpe = reference[2]
+    return [
+        package.get("name"),
+        package.get("version"),
+        purl,
+        cpe,
+        package.get("type"),
+        package.get("supplier"),
+        license,
+        ecosystem,
+        package.get("downloadlocation", "NOT KNOWN"),
+        package.get("copyrighttext", "-"),
+    ]
+
+
+def measure(packages, process, license_info):
+    # Memory retained by the package table of the report
+    tracemalloc.start()
+    start = time.perf_counter()
+    report = Report()
+    rows, records = process(SBOMAggregator(license_info), packages)
+    report.addtable(["Package"], rows, records=records)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, size, report.rows()
+
+
+def previous_rows(summary, packages):
+    return [previous_row(package, summary.license_info) for package in packages], False
+
+
+def report_records(summary, packages):
+    return [summary.add_package(package) for package in packages], True
+
+
+def main(argv=None):
+    argv = argv or sys.argv
+    count = int(argv[1]) if len(argv) > 1 else 100000
+    distinct = int(argv[2]) if len(argv) > 2 else 2000
+    license_info = LicenseScanner()
+    # Strings are built per package to reflect the output of the SBOM parser
+    packages = list(synthetic_packages(count, distinct))
+
+    results = [
+        ("previous", measure(packages, previous_rows, license_info)),
+        ("records", measure(packages, report_records, license_info)),
+    ]
+    print(f"{count} packages, {distinct} distinct")
+    print(f"{'Method':<10} {'Time (s)':>10} {'Packages/s':>12} {'Memory (MB)':>12}")
+    for method, (elapsed, size, rows) in results:
+        print(
+            f"{method:<10} {elapsed:>10.3f} {rows / elapsed:>12.0f} "
+            f"{size / (1024 * 1024):>12.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
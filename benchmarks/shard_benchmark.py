@@ -0,0 +1,59 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Speedup of formatting package rows in parallel shards against the number
+# of worker processes. Also checks that the rows and summary are identical
+# to serial processing.
+#
+# Usage: PYTHONPATH=. python benchmarks/shard_benchmark.py [packages] [max_workers]
+
+import os
+import sys
+import time
+
+from lib4sbom.license import LicenseScanner
+from synthetic import synthetic_packages
+
+from sbom2doc.aggregator import SBOMAggregator
+from sbom2doc.generator import _package_records
+
+
+def run(packages, workers, license_info):
+    summary = SBOMAggregator(license_info)
+    start = time.perf_counter()
+    records = list(_package_records(summary, packages, workers))
+    elapsed = time.perf_counter() - start
+    rows = [record.row() for record in records]
+    state = (
+        summary.package_count,
+        summary.packages_valid,
+        summary.component_summary(),
+        summary.license_summary(),
+        summary.supplier_summary(),
+    )
+    return elapsed, rows, state
+
+
+def main(argv=None):
+    argv = argv or sys.argv
+    count = int(argv[1]) if len(argv) > 1 else 200000
+    max_workers = int(argv[2]) if len(argv) > 2 else os.cpu_count()
+    license_info = LicenseScanner()
+    packages = list(synthetic_packages(count))
+    serial, expected_rows, expected_state = run(packages, None, license_info)
+    print(f"{count} packages, {os.cpu_count()} CPUs")
+    print(f"{'Workers':>8} {'Time (s)':>10} {'Speedup':>8}  Identical")
+    print(f"{'serial':>8} {serial:>10.3f} {1.0:>8.2f}")
+    failed = False
+    workers = 1
+    while workers <= max_workers:
+        elapsed, rows, state = run(packages, workers, license_info)
+        identical = rows == expected_rows and state == expected_state
+        failed = failed or not identical
+        print(f"{workers:>8} {elapsed:>10.3f} {serial / elapsed:>8.2f}  {identical}")
+        workers *= 2
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Peak memory and time taken to generate a spreadsheet package table for an
+# increasing number of packages, with and without high volume mode. Also
+# checks that both modes produce the same worksheets and cell contents.
+#
+# Usage: PYTHONPATH=. python benchmarks/spreadsheet_benchmark.py [max_packages]
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from lib4sbom.license import LicenseScanner
+from openpyxl import load_workbook
+from synthetic import synthetic_packages
+
+from sbom2doc.aggregator import SBOMAggregator
+from sbom2doc.docbuilder.spreadsheetbuilder import SpreadsheetBuilder
+
+HEADER = [
+    "Name",
+    "Version",
+    "PURL",
+    "CPE",
+    "Type",
+    "Supplier",
+    "License",
+    "Ecosystem",
+    "Download",
+    "Copyright",
+]
+
+
+def run(count, high_volume, license_info, filename):
+    summary = SBOMAggregator(license_info)
+    tracemalloc.start()
+    start = time.perf_counter()
+    builder = SpreadsheetBuilder()
+    builder.set_high_volume(high_volume)
+    builder.heading(1, "Package Summary")
+    builder.createtable(HEADER)
+    # Rows are generated as they are added to reflect generate_document
+    for package in synthetic_packages(count):
+        builder.addrow(summary.add_package(package).row())
+    builder.showtable()
+    builder.publish(filename)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+def build(high_volume, license_info, filename):
+    # Tables followed by license text paragraphs as in generate_document
+    summary = SBOMAggregator(license_info)
+    builder = SpreadsheetBuilder()
+    builder.set_high_volume(high_volume)
+    builder.heading(1, "Package Summary")
+    builder.createtable(HEADER)
+    for package in synthetic_packages(100):
+        builder.addrow(summary.add_package(package).row())
+    builder.showtable()
+    builder.heading(1, "License Summary")
+    builder.createtable(["License", "Count"])
+    for license, count in summary.license_summary():
+        builder.addrow([license, str(count)])
+    builder.showtable()
+    builder.heading(1, "License Text")
+    for license, _ in summary.license_summary():
+        builder.heading(2, license, number=False)
+        builder.paragraph(f"Text of {license}")
+    builder.publish(filename)
+    workbook = load_workbook(filename)
+    return [
+        (worksheet.title, list(worksheet.values)) for worksheet in workbook.worksheets
+    ]
+
+
+def main(argv=None):
+    argv = argv or sys.argv
+    max_packages = int(argv[1]) if len(argv) > 1 else 100000
+    license_info = LicenseScanner()
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "benchmark.xlsx")
+        identical = build(False, license_info, filename) == build(
+            True, license_info, filename
+        )
+        print(f"Standard and high volume workbooks identical: {identical}")
+        print(
+            f"{'Packages':>10} {'Standard (s)':>13} {'Peak (MB)':>10} "
+            f"{'High volume (s)':>16} {'Peak (MB)':>10}"
+        )
+        count = 1000
+        while count <= max_packages:
+            standard, standard_peak = run(count, False, license_info, filename)
+            high_volume, high_volume_peak = run(count, True, license_info, filename)
+            print(
+                f"{count:>10} {standard:>13.2f} {standard_peak:>10.1f} "
+                f"{high_volume:>16.2f} {high_volume_peak:>10.1f}"
+            )
+            count *= 10
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
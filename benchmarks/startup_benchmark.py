@@ -0,0 +1,105 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Measures the time taken to import sbom2doc and the builder for each
+# format in a fresh interpreter. Fails if a builder imports the backend of
+# another format or if the import time regresses against the baseline.
+#
+# Usage: PYTHONPATH=. python benchmarks/startup_benchmark.py [--save] [--runs N]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from sbom2doc.docbuilder.registry import get_formats
+
+BASELINE = os.path.join(os.path.dirname(__file__), "startup_baseline.json")
+
+# Backend modules which must only be imported by the named formats
+BACKENDS = {
+    "openpyxl": ["excel"],
+    "orjson": ["json-columnar", "ndjson"],
+    "reportlab": ["pdf"],
+    "rich": ["console"],
+    "requests": [],
+}
+
+# Builders included with sbom2doc
+FORMATS = get_formats(plugins=False)
+
+SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import sbom2doc.cli
+from sbom2doc.docbuilder.registry import get_builder
+get_builder({format!r})
+elapsed = time.perf_counter() - start
+modules = [m for m in {backends!r} if m in sys.modules]
+print(elapsed, ",".join(modules))
+"""
+
+
+def measure(format, runs):
+    times = []
+    loaded = []
+    for _ in range(runs):
+        script = SCRIPT.format(format=format, backends=list(BACKENDS))
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(output[0]))
+        loaded = output[1].split(",") if len(output) > 1 else []
+    return statistics.median(times), loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="sbom2doc startup benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--save", action="store_true", help="save as baseline")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="allowed slowdown relative to the baseline (default: 0.5 = 50%%)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(BASELINE):
+        with open(BASELINE, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    failed = False
+    results = {}
+    print(f"{'Format':<13} {'Import (ms)':>12} {'Baseline (ms)':>14}  Backends")
+    for format in FORMATS:
+        elapsed, loaded = measure(format, args.runs)
+        results[format] = round(elapsed * 1000, 1)
+        expected = baseline.get(format)
+        status = ""
+        unexpected = [m for m in loaded if format not in BACKENDS[m]]
+        if len(unexpected) > 0:
+            status = f"UNEXPECTED IMPORT {','.join(unexpected)}"
+            failed = True
+        elif expected is not None and results[format] > expected * (1 + args.tolerance):
+            status = "REGRESSION"
+            failed = True
+        print(
+            f"{format:<13} {results[format]:>12} {str(expected or '-'):>14}  "
+            f"{','.join(loaded) or '-'} {status}"
+        )
+
+    if args.save:
+        with open(BASELINE, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
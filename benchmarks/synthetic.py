@@ -0,0 +1,260 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+# Deterministic synthetic SBOM data for benchmarks. SBOM files can also be
+# written for use with sbom2doc e.g.
+#
+# Usage: python benchmarks/synthetic.py --packages 10000 --files 1000
+#            --relationships 30000 --vulnerabilities 100 -t cyclonedx -o sbom.json
+
+import argparse
+import hashlib
+import itertools
+import json
+import sys
+
+LICENSES = ["Apache-2.0", "MIT", "BSD-3-Clause", "GPL-2.0", "NOASSERTION"]
+TYPES = ["LIBRARY", "APPLICATION", "FRAMEWORK", "CONTAINER"]
+ECOSYSTEMS = ["pypi", "npm", "maven", "golang", "cargo"]
+SEVERITIES = ["critical", "high", "medium", "low", "none"]
+STATES = ["exploitable", "in_triage", "not_affected", "resolved"]
+
+
+def synthetic_licenses(count):
+    # The common licenses followed by license references
+    return [
+        LICENSES[i] if i < len(LICENSES) else f"LicenseRef-Synthetic-{i}"
+        for i in range(count)
+    ]
+
+
+def synthetic_packages(count, distinct=None, licenses=None):
+    # If distinct is specified, packages are repeated (as found in monorepo
+    # SBOMs) after the given number of distinct packages
+    license_names = synthetic_licenses(licenses) if licenses else LICENSES
+    for i in range(count):
+        n = i % distinct if distinct else i
+        ecosystem = ECOSYSTEMS[n % len(ECOSYSTEMS)]
+        version = f"{n % 10}.{n % 7}.{n % 3}"
+        yield {
+            "id": f"SPDXRef-Package-{i}",
+            "name": f"package-{n}",
+            "version": version,
+            "type": TYPES[n % len(TYPES)],
+            "supplier": f"Organization: Supplier {n % 250}",
+            "licenseconcluded": license_names[n % len(license_names)],
+            "downloadlocation": "NOASSERTION",
+            "copyrighttext": "NOASSERTION",
+            "externalreference": [
+                ["PACKAGE-MANAGER", "purl", f"pkg:{ecosystem}/package-{n}@{version}"],
+            ],
+        }
+
+
+def synthetic_relationships(count, fanout=3):
+    # Each package depends on up to fanout packages with a higher number so
+    # the graph is acyclic apart from a cycle every 1000 packages
+    yield {
+        "source": "DOCUMENT",
+        "type": "DESCRIBES",
+        "target": "package-0",
+        "source_id": "SPDXRef-DOCUMENT",
+        "target_id": "SPDXRef-Package-0",
+    }
+    for i in range(count):
+        targets = [i + 1 + (i * 7 + k * 13) % 50 for k in range(fanout)]
+        if i % 1000 == 0:
+            targets.append(i + 1)
+        elif i % 1000 == 1:
+            targets.append(i - 1)
+        for j in targets:
+            if j < count:
+                yield {
+                    "source": f"package-{i}",
+                    "type": "DEPENDS_ON",
+                    "target": f"package-{j}",
+                    "source_id": f"SPDXRef-Package-{i}",
+                    "target_id": f"SPDXRef-Package-{j}",
+                }
+
+
+def synthetic_files(count, licenses=None):
+    license_names = synthetic_licenses(licenses) if licenses else LICENSES
+    for i in range(count):
+        name = f"./src/module-{i // 100}/file-{i}.py"
+        yield {
+            "id": f"SPDXRef-File-{i}",
+            "name": name,
+            "checksum": hashlib.sha1(name.encode("utf-8")).hexdigest(),
+            "license": license_names[i % len(license_names)],
+        }
+
+
+def synthetic_vulnerabilities(count, packages):
+    # Vulnerabilities are spread across the packages
+    for i in range(count):
+        yield {
+            "id": f"CVE-2024-{10000 + i}",
+            "package": (i * 7) % packages,
+            "severity": SEVERITIES[i % len(SEVERITIES)],
+            "state": STATES[i % len(STATES)],
+        }
+
+
+def write_spdx(filename, packages, files=0, relationships=0, licenses=None):
+    # SPDX tag value document. SPDX 2 documents do not contain
+    # vulnerabilities.
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(
+            "SPDXVersion: SPDX-2.3\n"
+            "DataLicense: CC0-1.0\n"
+            "SPDXID: SPDXRef-DOCUMENT\n"
+            "DocumentName: synthetic\n"
+            "DocumentNamespace: https://example.com/synthetic\n"
+            "Creator: Tool: sbom2doc-benchmark\n"
+            "Created: 2024-01-01T00:00:00Z\n"
+        )
+        for package in synthetic_packages(packages, licenses=licenses):
+            purl = package["externalreference"][0][2]
+            f.write(
+                f"\nPackageName: {package['name']}\n"
+                f"SPDXID: {package['id']}\n"
+                f"PackageVersion: {package['version']}\n"
+                f"PrimaryPackagePurpose: {package['type']}\n"
+                f"PackageSupplier: {package['supplier']}\n"
+                f"PackageDownloadLocation: {package['downloadlocation']}\n"
+                "FilesAnalyzed: false\n"
+                f"PackageLicenseConcluded: {package['licenseconcluded']}\n"
+                "PackageLicenseDeclared: NOASSERTION\n"
+                f"PackageCopyrightText: {package['copyrighttext']}\n"
+                f"ExternalRef: PACKAGE-MANAGER purl {purl}\n"
+            )
+        for file in synthetic_files(files, licenses=licenses):
+            f.write(
+                f"\nFileName: {file['name']}\n"
+                f"SPDXID: {file['id']}\n"
+                f"FileChecksum: SHA1: {file['checksum']}\n"
+                f"LicenseConcluded: {file['license']}\n"
+                "FileCopyrightText: NOASSERTION\n"
+            )
+        f.write("\n")
+        # The first relationship describes the first package
+        for relationship in itertools.islice(
+            synthetic_relationships(packages), relationships + 1
+        ):
+            f.write(
+                f"Relationship: {relationship['source_id']} "
+                f"{relationship['type']} {relationship['target_id']}\n"
+            )
+
+
+def write_cyclonedx(
+    filename, packages, files=0, relationships=0, licenses=None, vulnerabilities=0
+):
+    # CycloneDX JSON document. Files are components of type file.
+    components = []
+    for package in synthetic_packages(packages, licenses=licenses):
+        component = {
+            "type": package["type"].lower(),
+            "bom-ref": package["id"],
+            "name": package["name"],
+            "version": package["version"],
+            "supplier": {"name": package["supplier"].split(": ", 1)[1]},
+            "purl": package["externalreference"][0][2],
+        }
+        if package["licenseconcluded"] != "NOASSERTION":
+            component["licenses"] = [{"license": {"id": package["licenseconcluded"]}}]
+        components.append(component)
+    for file in synthetic_files(files, licenses=licenses):
+        components.append(
+            {
+                "type": "file",
+                "bom-ref": file["id"],
+                "name": file["name"],
+                "version": "1",
+                "hashes": [{"alg": "SHA-1", "content": file["checksum"]}],
+            }
+        )
+    dependencies = {}
+    for relationship in itertools.islice(
+        synthetic_relationships(packages), 1, relationships + 1
+    ):
+        dependencies.setdefault(relationship["source_id"], []).append(
+            relationship["target_id"]
+        )
+    document = {
+        "bomFormat": "CycloneDX",
+        "specVersion": "1.5",
+        "serialNumber": "urn:uuid:00000000-0000-4000-8000-000000000000",
+        "version": 1,
+        "metadata": {
+            "timestamp": "2024-01-01T00:00:00Z",
+            "tools": [{"name": "sbom2doc-benchmark"}],
+            "component": {
+                "type": "application",
+                "bom-ref": "SPDXRef-Package-0",
+                "name": "synthetic",
+            },
+        },
+        "components": components,
+        "dependencies": [
+            {"ref": ref, "dependsOn": targets} for ref, targets in dependencies.items()
+        ],
+    }
+    if vulnerabilities > 0:
+        document["vulnerabilities"] = [
+            {
+                "bom-ref": vulnerability["id"],
+                "id": vulnerability["id"],
+                "source": {"name": "NVD"},
+                "ratings": [{"severity": vulnerability["severity"]}],
+                "analysis": {"state": vulnerability["state"]},
+                "affects": [{"ref": f"SPDXRef-Package-{vulnerability['package']}"}],
+            }
+            for vulnerability in synthetic_vulnerabilities(vulnerabilities, packages)
+        ]
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(document, f)
+
+
+def write_sbom(
+    filename,
+    sbom_type,
+    packages,
+    files=0,
+    relationships=0,
+    licenses=None,
+    vulnerabilities=0,
+):
+    if sbom_type == "spdx":
+        write_spdx(filename, packages, files, relationships, licenses)
+    else:
+        write_cyclonedx(
+            filename, packages, files, relationships, licenses, vulnerabilities
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetic SBOM generator")
+    parser.add_argument("--packages", type=int, default=1000)
+    parser.add_argument("--files", type=int, default=0)
+    parser.add_argument("--relationships", type=int, default=0)
+    parser.add_argument("--licenses", type=int, default=len(LICENSES))
+    parser.add_argument("--vulnerabilities", type=int, default=0, help="cyclonedx only")
+    parser.add_argument("-t", "--type", choices=["spdx", "cyclonedx"], default="spdx")
+    parser.add_argument("-o", "--output-file", required=True)
+    args = parser.parse_args(argv)
+    write_sbom(
+        args.output_file,
+        args.type,
+        args.packages,
+        args.files,
+        args.relationships,
+        args.licenses,
+        args.vulnerabilities,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import Counter
+
+from sbom2doc.records import FileRecord, PackageRecord, external_references, intern
+
+
+class SBOMAggregator:
+    # Collects all of the summary data for a SBOM in a single pass over the
+    # files and packages. A record is returned as each element is added so
+    # that callers can render it without scanning the data again.
+
+    def __init__(self, license_info):
+        self.license_info = license_info
+        self.license_names = {}
+        self.file_count = 0
+        self.package_count = 0
+        self.relationship_count = 0
+        self.service_count = 0
+        self.vulnerability_count = 0
+        self.files_valid = True
+        self.packages_valid = True
+        self.creator_identified = False
+        self.creation_time = False
+        self.components = Counter()
+        self.licenses = Counter()
+        self.suppliers = Counter()
+
+    def _license(self, license):
+        # Deprecation check only performed once per distinct license
+        name = self.license_names.get(license)
+        if name is None:
+            name = intern(license)
+            if license != "NOT KNOWN" and self.license_info.deprecated(license):
+                name = intern(f"{license} (Deprecated)")
+            self.license_names[license] = name
+        return name
+
+    def add_document(self, document):
+        creator = document.get_creator()
+        # If creator is missing, will return None
+        self.creator_identified = creator is not None and len(creator) > 0
+        self.creation_time = document.get_created() is not None
+
+    def add_relationships(self, relationships):
+        self.relationship_count = len(relationships)
+
+    def add_services(self, services):
+        self.service_count = len(services)
+
+    def add_vulnerabilities(self, vulnerabilities):
+        self.vulnerability_count = len(vulnerabilities)
+
+    def check_file(self, file):
+        # Minimum elements are ID, Name
+        self.file_count += 1
+        if file.get("id", None) is None or file.get("name", None) is None:
+            self.files_valid = False
+
+    def add_file(self, file):
+        self.check_file(file)
+        name = file.get("name", None)
+        filetype = file.get("filetype", None)
+        if filetype is not None:
+            file_type = ", ".join(t for t in filetype)
+        else:
+            file_type = "NOT KNOWN"
+        license = intern(file.get("licenseconcluded", "NOT KNOWN"))
+        copyright = file.get("copyrighttext", "-")
+        self.licenses[license] += 1
+        return FileRecord(name, intern(file_type), license, copyright)
+
+    def check_package(self, package):
+        # Minimum elements are ID, Name, Version, Supplier
+        self.package_count += 1
+        supplier = package.get("supplier", None)
+        if (
+            package.get("id", None) is None
+            or package.get("name", None) is None
+            or package.get("version", None) is None
+            or supplier is None
+            or supplier == "NOASSERTION"
+        ):
+            self.packages_valid = False
+
+    def add_package(self, package):
+        self.check_package(package)
+        name = package.get("name", None)
+        version = package.get("version", None)
+        type = intern(package.get("type", None))
+        supplier = intern(package.get("supplier", None))
+        license = self._license(package.get("licenseconcluded", "NOT KNOWN"))
+        self.licenses[license] += 1
+        self.components[type] += 1
+        if supplier is not None:
+            self.suppliers[supplier] += 1
+        purl, cpe, ecosystem = external_references(package)
+        download = package.get("downloadlocation", "NOT KNOWN")
+        copyright = package.get("copyrighttext", "-")
+        return PackageRecord(
+            name,
+            version,
+            purl,
+            cpe,
+            type,
+            supplier,
+            license,
+            ecosystem,
+            download,
+            copyright,
+        )
+
+    def add_record(self, record):
+        # Summary of a package which has been processed by another aggregator
+        self.package_count += 1
+        self.licenses[record.license] += 1
+        self.components[record.type] += 1
+        if record.supplier is not None:
+            self.suppliers[record.supplier] += 1
+
+    def prepare_licenses(self, packages):
+        # Resolve the name of each distinct license so that packages can be
+        # processed by another aggregator without access to the license data
+        for package in packages:
+            self._license(package.get("licenseconcluded", "NOT KNOWN"))
+        return self.license_names
+
+    def merge(self, other):
+        # Combine the summary of packages processed by another aggregator
+        self.file_count += other.file_count
+        self.package_count += other.package_count
+        self.files_valid = self.files_valid and other.files_valid
+        self.packages_valid = self.packages_valid and other.packages_valid
+        self.components.update(other.components)
+        self.licenses.update(other.licenses)
+        self.suppliers.update(other.suppliers)
+
+    def relationships_valid(self):
+        return self.relationship_count > 0
+
+    def valid_sbom(self):
+        return (
+            self.files_valid
+            and self.packages_valid
+            and self.creator_identified
+            and self.creation_time
+            and self.relationships_valid()
+        )
+
+    def ntia_summary(self):
+        return [
+            ["All file information provided?", self.files_valid],
+            ["All package information provided?", self.packages_valid],
+            ["Creator identified?", self.creator_identified],
+            ["Creation time identified?", self.creation_time],
+            ["Dependency relationships provided?", self.relationships_valid()],
+        ]
+
+    def component_summary(self):
+        return sorted(self.components.items())
+
+    def license_summary(self):
+        return sorted(self.licenses.items())
+
+    def supplier_summary(self):
+        return sorted(self.suppliers.items())
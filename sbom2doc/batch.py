@@ -0,0 +1,197 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import sbom2doc.generator as generator
+from sbom2doc.ingest import SBOMInputParser, sbom_name
+from sbom2doc.licensecache import LicenseCache
+from sbom2doc.resultcache import ResultCache, file_digest
+
+FILE_EXTENSION = {
+    "excel": "xlsx",
+    "html": "html",
+    "json": "json",
+    "json-columnar": "columnar.json",
+    "markdown": "md",
+    "ndjson": "ndjson",
+    "pdf": "pdf",
+}
+
+SBOM_EXTENSIONS = [
+    ".bom.json",
+    ".cdx.json",
+    ".bom.xml",
+    ".cdx.xml",
+    ".spdx.json",
+    ".spdx.yaml",
+    ".spdx.yml",
+    ".spdx.rdf",
+    ".spdx.xml",
+    ".spdx",
+    ".jsonld",
+    ".json",
+    ".xml",
+]
+
+SUMMARY_FILE = "sbom2doc-batch.json"
+
+
+def _glob_pattern(name):
+    return any(c in name for c in "*?[")
+
+
+def _manifest(filename):
+    # One SBOM per line. Blank lines and comments are ignored. Relative
+    # paths are relative to the location of the manifest.
+    base = os.path.dirname(filename)
+    inputs = []
+    with open(filename, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if len(line) == 0 or line.startswith("#"):
+                continue
+            inputs.append(os.path.join(base, line))
+    return inputs
+
+
+def find_inputs(source):
+    # Source is a directory, a glob pattern or a manifest file
+    if os.path.isdir(source):
+        inputs = [
+            os.path.join(source, name)
+            for name in os.listdir(source)
+            if sbom_name(name).endswith(tuple(SBOM_EXTENSIONS))
+            and os.path.isfile(os.path.join(source, name))
+        ]
+    elif _glob_pattern(source):
+        inputs = [name for name in glob.glob(source, recursive=True)]
+        inputs = [name for name in inputs if os.path.isfile(name)]
+    elif os.path.isfile(source):
+        inputs = _manifest(source)
+    else:
+        inputs = []
+    return sorted(inputs)
+
+
+def output_filename(input_file, output_dir, format, used=None):
+    name = sbom_name(os.path.basename(input_file))
+    for extension in SBOM_EXTENSIONS:
+        if name.endswith(extension):
+            name = name[: -len(extension)]
+            break
+    extension = FILE_EXTENSION.get(format, format)
+    outfile = os.path.join(output_dir, f"{name}.{extension}")
+    if used is not None:
+        # Avoid clashes between inputs with the same name
+        count = 1
+        while outfile in used:
+            count += 1
+            outfile = os.path.join(output_dir, f"{name}-{count}.{extension}")
+        used.add(outfile)
+    return outfile
+
+
+def document_sbom(
+    input_file,
+    output_file,
+    format,
+    include_license,
+    cache_dir="",
+    use_cache=True,
+    **options,
+):
+    # Errors are reported rather than raised so that a single invalid SBOM
+    # does not stop the processing of the remaining SBOMs
+    result = {"input": input_file, "output": output_file, "status": "ok"}
+    start = time.perf_counter()
+    license_cache = LicenseCache(cache_dir=cache_dir, enabled=use_cache)
+    result_cache = ResultCache(cache_dir=cache_dir, enabled=use_cache)
+    try:
+        key = result_cache.key(
+            file_digest(input_file), format, include_license, input_file, **options
+        )
+        result["cached"] = result_cache.get(key, output_file)
+        if not result["cached"]:
+            sbom_parser = SBOMInputParser()
+            sbom_parser.parse_file(input_file)
+            result["parse_time"] = round(time.perf_counter() - start, 6)
+            generator.generate_document(
+                format,
+                sbom_parser,
+                input_file,
+                output_file,
+                include_license,
+                license_cache=license_cache,
+                **options,
+            )
+            result_cache.put(key, output_file)
+    except FileNotFoundError:
+        result["status"] = "failed"
+        result["error"] = f"{input_file} not found"
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = type(e).__name__
+        if len(str(e)) > 0:
+            result["error"] = f"{type(e).__name__}: {e}"
+    license_cache.close()
+    result["time"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def _document_sbom(task):
+    arguments, options = task
+    return document_sbom(*arguments, **options)
+
+
+def run_batch(
+    inputs,
+    output_dir,
+    format,
+    include_license,
+    workers=None,
+    cache_dir="",
+    use_cache=True,
+    **options,
+):
+    # Options are passed to generate_document
+    os.makedirs(output_dir, exist_ok=True)
+    used = set()
+    tasks = [
+        (
+            (
+                input_file,
+                output_filename(input_file, output_dir, format, used),
+                format,
+                include_license,
+                cache_dir,
+                use_cache,
+            ),
+            options,
+        )
+        for input_file in inputs
+    ]
+    start = time.perf_counter()
+    if workers == 1 or len(tasks) <= 1:
+        results = [_document_sbom(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Results are returned in the same order as the inputs
+            results = list(executor.map(_document_sbom, tasks, chunksize=4))
+    failures = [result for result in results if result["status"] != "ok"]
+    summary = {
+        "format": format,
+        "workers": workers or os.cpu_count(),
+        "total": len(results),
+        "succeeded": len(results) - len(failures),
+        "failed": len(failures),
+        "time": round(time.perf_counter() - start, 6),
+        "results": results,
+    }
+    with open(os.path.join(output_dir, SUMMARY_FILE), "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    return summary
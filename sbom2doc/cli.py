@@ -2,13 +2,28 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
+import os
 import sys
 import textwrap
 from collections import ChainMap
 
-from lib4sbom.parser import SBOMParser
-
+import sbom2doc.batch as batch
+import sbom2doc.docbuilder.registry as registry
 import sbom2doc.generator as generator
+from sbom2doc.delta import PackageIndex, build_delta_report, is_snapshot
+from sbom2doc.ingest import (
+    STDIN,
+    SBOMInputError,
+    SBOMInputParser,
+    SBOMStream,
+    reading,
+    stream_type,
+)
+from sbom2doc.licensecache import LicenseCache
+from sbom2doc.portfolio import SECTIONS as PORTFOLIO_SECTIONS
+from sbom2doc.portfolio import build_portfolio_report, run_portfolio
+from sbom2doc.profiler import Profiler
+from sbom2doc.resultcache import ResultCache, file_digest
 from sbom2doc.version import VERSION
 
 # CLI processing
@@ -31,7 +46,56 @@ def main(argv=None):
         "--input-file",
         action="store",
         default="",
-        help="Name of SBOM file",
+        help="Name of SBOM file ('-' for standard input)",
+    )
+    input_group.add_argument(
+        "--stream-input",
+        action="store_true",
+        default=False,
+        help="read the SBOM incrementally to reduce memory usage "
+        "(SPDX tag value and CycloneDX JSON only)",
+    )
+    input_group.add_argument(
+        "--diff",
+        action="store",
+        default="",
+        metavar="PREVIOUS",
+        help="document the changes from a previous SBOM or snapshot",
+    )
+    input_group.add_argument(
+        "-b",
+        "--batch",
+        action="store",
+        default="",
+        help="document multiple SBOMs specified as a directory, glob pattern "
+        "or manifest file",
+    )
+    input_group.add_argument(
+        "--portfolio",
+        action="store",
+        default="",
+        metavar="SOURCE",
+        help="document multiple SBOMs specified as a directory, glob pattern "
+        "or manifest file as a single portfolio",
+    )
+    input_group.add_argument(
+        "--serve",
+        action="store",
+        nargs="?",
+        const="127.0.0.1:8080",
+        default="",
+        metavar="ADDRESS",
+        help="run as a document server listening on ADDRESS "
+        "(default: 127.0.0.1:8080)",
+    )
+    input_group.add_argument(
+        "--workers",
+        action="store",
+        type=int,
+        default=0,
+        help="number of worker processes used in batch mode, concurrent "
+        "requests in server mode or parallel rendering "
+        "(default: number of CPUs)",
     )
 
     output_group = parser.add_argument_group("Output")
@@ -49,13 +113,82 @@ def main(argv=None):
         help="add license text",
     )
 
+    output_group.add_argument(
+        "--include-sections",
+        action="store",
+        default="",
+        metavar="SECTIONS",
+        help="comma separated list of sections to include "
+        f"(choose from {', '.join(generator.SECTIONS)}; default: all)",
+    )
+
+    output_group.add_argument(
+        "--exclude-sections",
+        action="store",
+        default="",
+        metavar="SECTIONS",
+        help="comma separated list of sections to exclude",
+    )
+
+    output_group.add_argument(
+        "--stream",
+        action="store_true",
+        default=False,
+        help="write output incrementally (markdown, html and json formats only)",
+    )
+
+    output_group.add_argument(
+        "--high-volume",
+        action="store_true",
+        default=False,
+        help="optimise output for very large SBOMs "
+        "(console, excel, html and pdf formats only)",
+    )
+
+    output_group.add_argument(
+        "--sharded",
+        action="store_true",
+        default=False,
+        help="format package rows in parallel using --workers processes",
+    )
+
+    output_group.add_argument(
+        "--profile",
+        action="store",
+        default="",
+        help="write timing and memory usage of each phase as JSON to file "
+        "('-' for stdout)",
+    )
+
+    output_group.add_argument(
+        "--cprofile",
+        action="store",
+        default="",
+        help="write cProfile statistics to file",
+    )
+
+    output_group.add_argument(
+        "--cache-dir",
+        action="store",
+        default="",
+        help="directory for cached data (default: ~/.cache/sbom2doc)",
+    )
+
+    output_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="do not use cached data",
+    )
+
     # Add format option
     output_group.add_argument(
         "-f",
         "--format",
         action="store",
-        help="Output format (default: output to console)",
-        choices=["console", "excel", "html", "json", "markdown", "pdf"],
+        help="Output format, or a comma separated list of formats "
+        "(default: output to console)",
+        metavar="{" + ",".join(registry.get_formats(plugins=False)) + "}",
         default="console",
     )
 
@@ -67,14 +200,55 @@ def main(argv=None):
         help="output filename (default: output to stdout)",
     )
 
+    output_group.add_argument(
+        "--snapshot",
+        action="store",
+        default="",
+        help="save a snapshot of the packages for use with --diff",
+    )
+
+    output_group.add_argument(
+        "--parallel",
+        action="store",
+        choices=["thread", "process"],
+        default="",
+        help="render multiple formats in parallel using threads or processes",
+    )
+
+    output_group.add_argument(
+        "--output-dir",
+        action="store",
+        default="",
+        help="output directory for batch mode",
+    )
+
     parser.add_argument("-V", "--version", action="version", version=VERSION)
 
     defaults = {
         "input_file": "",
+        "diff": "",
+        "batch": "",
+        "portfolio": "",
+        "serve": "",
+        "workers": 0,
+        "output_dir": "",
+        "snapshot": "",
+        "parallel": "",
         "output_file": "",
         "debug": False,
         "format": "console",
         "include_license": False,
+        "include_sections": "",
+        "exclude_sections": "",
+        "stream": False,
+        "stream_input": False,
+        "high_volume": False,
+        "sharded": False,
+        "profile": "",
+        "cprofile": "",
+        "cache_dir": "",
+        "no_cache": False,
+        "sections": None,
     }
 
     raw_args = parser.parse_args(argv[1:])
@@ -83,38 +257,318 @@ def main(argv=None):
 
     # Validate CLI parameters
 
+    # Additional formats may be provided by plugins
+    formats = args["format"].split(",")
+    for format in formats:
+        if not registry.is_format(format):
+            parser.error(
+                f"argument -f/--format: invalid choice: '{format}' "
+                f"(choose from {', '.join(registry.get_formats())})"
+            )
+    if len(formats) > 1 and (args["serve"] != "" or args["batch"] != ""):
+        parser.error("argument -f/--format: only one format allowed")
+
+    # Sections which are not selected are not built. Portfolio reports have
+    # their own sections.
+    choices = PORTFOLIO_SECTIONS if args["portfolio"] != "" else generator.SECTIONS
+    sections = {}
+    for option in ["include_sections", "exclude_sections"]:
+        if args[option] != "":
+            sections[option] = args[option].split(",")
+            for section in sections[option]:
+                if section not in choices:
+                    parser.error(
+                        f"argument --{option.replace('_', '-')}: invalid choice: "
+                        f"'{section}' (choose from {', '.join(choices)})"
+                    )
+    if len(sections) > 0:
+        args["sections"] = generator.select_sections(
+            sections.get("include_sections"),
+            sections.get("exclude_sections"),
+            choices=choices,
+        )
+
+    if args["serve"] != "":
+        import sbom2doc.server as server
+
+        return server.serve(
+            args["serve"],
+            workers=args["workers"] or os.cpu_count(),
+            cache_dir=args["cache_dir"],
+            use_cache=not args["no_cache"],
+        )
+
+    if args["batch"] != "":
+        return batch_main(args)
+
+    if args["portfolio"] != "":
+        return portfolio_main(args, formats)
+
     input_file = args["input_file"]
 
     if input_file == "":
         print("[ERROR] SBOM name must be specified.")
         return -1
 
-    if args["format"] != "console" and args["output_file"] == "":
+    if formats != ["console"] and args["output_file"] == "":
         print("[ERROR] Output filename must be specified.")
         return -1
 
+    if args["diff"] != "":
+        return diff_main(args, formats)
+
     if args["debug"]:
         print("Input file", args["input_file"])
         print("Output file", args["output_file"])
         print("Include license text", args["include_license"])
 
-    sbom_parser = SBOMParser()
-    # Load SBOM - will autodetect SBOM type
+    license_cache = LicenseCache(
+        cache_dir=args["cache_dir"], enabled=not args["no_cache"]
+    )
+    # Documents are cached for unchanged SBOMs
+    result_cache = ResultCache(
+        cache_dir=args["cache_dir"], enabled=not args["no_cache"]
+    )
+    profiler = Profiler(cprofile=args["cprofile"] or None)
+    status = 0
+    # Load SBOM - will autodetect SBOM type. Only errors reading the SBOM
+    # are reported; streamed elements are read as the document is generated.
+    try:
+        with reading(input_file):
+            if args["stream_input"] and stream_type(input_file) is not None:
+                sbom_parser = SBOMStream()
+            else:
+                sbom_parser = SBOMInputParser()
+        documents = output_files(formats, args["output_file"])
+        keys = {}
+        pending = []
+        with profiler.phase("result_cache"):
+            for format, outfile in documents:
+                # Standard input can only be read once
+                if input_file != STDIN and result_cache.cacheable(format, outfile):
+                    if len(keys) == 0:
+                        with reading(input_file):
+                            digest = file_digest(input_file)
+                    keys[outfile] = result_cache.key(
+                        digest,
+                        format,
+                        args["include_license"],
+                        input_file,
+                        stream=args["stream"],
+                        high_volume=args["high_volume"],
+                        stream_input=args["stream_input"],
+                        sections=args["sections"],
+                    )
+                    if result_cache.get(keys[outfile], outfile):
+                        continue
+                pending.append((format, outfile))
+        profiler.record_cache("result", result_cache.hits, result_cache.misses)
+
+        if len(pending) > 0:
+            with profiler.phase("parse"), reading(input_file):
+                sbom_parser.parse_file(input_file)
+
+            # SBOM is only analysed once for all formats
+            generator.generate_documents(
+                pending,
+                sbom_parser,
+                input_file,
+                args["include_license"],
+                stream=args["stream"],
+                license_cache=license_cache,
+                high_volume=args["high_volume"],
+                profiler=profiler,
+                parallel=args["parallel"] or None,
+                workers=args["workers"] or None,
+                row_workers=(
+                    (args["workers"] or os.cpu_count()) if args["sharded"] else None
+                ),
+                sections=args["sections"],
+            )
+            for format, outfile in pending:
+                if outfile in keys:
+                    result_cache.put(keys[outfile], outfile)
+
+        if args["snapshot"] != "":
+            if len(pending) == 0:
+                with reading(input_file):
+                    sbom_parser.parse_file(input_file)
+            PackageIndex.from_parser(sbom_parser, license_cache, input_file).save(
+                args["snapshot"]
+            )
+
+    except SBOMInputError as e:
+        print(f"[ERROR] {e}")
+        status = -1
+
+    license_cache.close()
+    profiler.stop()
+    if args["profile"] != "":
+        profiler.write(args["profile"])
+    return status
+
+
+def output_files(formats, output_file):
+    # With multiple formats, the extension of the output file is replaced
+    # by the extension for each format
+    if len(formats) == 1:
+        return [(formats[0], output_file)]
+    name = output_file
+    for extension in sorted(batch.FILE_EXTENSION.values(), key=len, reverse=True):
+        if name.endswith(f".{extension}"):
+            name = name[: -len(extension) - 1]
+            break
+    return [
+        (
+            format,
+            (
+                ""
+                if format == "console"
+                else f"{name}.{batch.FILE_EXTENSION.get(format, format)}"
+            ),
+        )
+        for format in formats
+    ]
+
+
+def diff_main(args, formats):
+    input_file = args["input_file"]
+    previous_file = args["diff"]
+    if args["debug"]:
+        print("Previous file", previous_file)
+        print("Input file", input_file)
+        print("Output file", args["output_file"])
+
+    license_cache = LicenseCache(
+        cache_dir=args["cache_dir"], enabled=not args["no_cache"]
+    )
+    profiler = Profiler(cprofile=args["cprofile"] or None)
+    status = 0
     try:
-        sbom_parser.parse_file(input_file)
-
-        generator.generate_document(
-            args["format"],
-            sbom_parser,
-            input_file,
-            args["output_file"],
-            args["include_license"],
+        with profiler.phase("parse"):
+            with reading(previous_file):
+                if is_snapshot(previous_file):
+                    previous = PackageIndex.load(previous_file)
+                else:
+                    sbom_parser = SBOMInputParser()
+                    sbom_parser.parse_file(previous_file)
+                    previous = PackageIndex.from_parser(
+                        sbom_parser, license_cache, previous_file
+                    )
+            with reading(input_file):
+                sbom_parser = SBOMInputParser()
+                sbom_parser.parse_file(input_file)
+                current = PackageIndex.from_parser(
+                    sbom_parser, license_cache, input_file
+                )
+
+        # Previous index is updated to the current SBOM
+        report = build_delta_report(previous, current, profiler)
+        generator.render_documents(
+            report,
+            output_files(formats, args["output_file"]),
+            stream=args["stream"],
+            high_volume=args["high_volume"],
+            profiler=profiler,
+            parallel=args["parallel"] or None,
+            workers=args["workers"] or None,
+        )
+        if args["snapshot"] != "":
+            previous.save(args["snapshot"])
+
+    except SBOMInputError as e:
+        print(f"[ERROR] {e}")
+        status = -1
+
+    license_cache.close()
+    profiler.stop()
+    if args["profile"] != "":
+        profiler.write(args["profile"])
+    return status
+
+
+def portfolio_main(args, formats):
+    if formats != ["console"] and args["output_file"] == "":
+        print("[ERROR] Output filename must be specified.")
+        return -1
+
+    inputs = batch.find_inputs(args["portfolio"])
+    if len(inputs) == 0:
+        print(f"[ERROR] No SBOMs found in {args['portfolio']}.")
+        return -1
+
+    if args["debug"]:
+        print("Portfolio", args["portfolio"], "-", len(inputs), "SBOMs")
+        print("Output file", args["output_file"])
+
+    profiler = Profiler(cprofile=args["cprofile"] or None)
+    with profiler.phase("parse") as phase:
+        portfolio = run_portfolio(
+            inputs,
+            workers=args["workers"] or None,
+            cache_dir=args["cache_dir"],
+            use_cache=not args["no_cache"],
         )
+        phase["rows"] = len(inputs)
+    report = build_portfolio_report(portfolio, profiler, args["sections"])
+    generator.render_documents(
+        report,
+        output_files(formats, args["output_file"]),
+        stream=args["stream"],
+        high_volume=args["high_volume"],
+        profiler=profiler,
+        parallel=args["parallel"] or None,
+        workers=args["workers"] or None,
+    )
+    for input_file, error in portfolio.failed:
+        print(f"[ERROR] {input_file}: {error}")
+
+    profiler.stop()
+    if args["profile"] != "":
+        profiler.write(args["profile"])
+    return 0 if len(portfolio.failed) == 0 else -1
 
-    except FileNotFoundError:
-        print(f"{input_file} not found")
 
-    return 0
+def batch_main(args):
+    if args["format"] == "console":
+        print("[ERROR] Console format not supported in batch mode.")
+        return -1
+
+    if args["output_dir"] == "":
+        print("[ERROR] Output directory must be specified.")
+        return -1
+
+    inputs = batch.find_inputs(args["batch"])
+    if len(inputs) == 0:
+        print(f"[ERROR] No SBOMs found in {args['batch']}.")
+        return -1
+
+    if args["debug"]:
+        print("Batch", args["batch"], "-", len(inputs), "SBOMs")
+        print("Output directory", args["output_dir"])
+
+    summary = batch.run_batch(
+        inputs,
+        args["output_dir"],
+        args["format"],
+        args["include_license"],
+        workers=args["workers"] or None,
+        cache_dir=args["cache_dir"],
+        use_cache=not args["no_cache"],
+        stream=args["stream"],
+        high_volume=args["high_volume"],
+        sections=args["sections"],
+    )
+    for result in summary["results"]:
+        if result["status"] != "ok":
+            print(f"[ERROR] {result['input']}: {result['error']}")
+        elif args["debug"]:
+            print(f"{result['input']} -> {result['output']} ({result['time']}s)")
+    print(
+        f"Documented {summary['succeeded']} of {summary['total']} SBOMs "
+        f"in {summary['time']:.2f}s ({summary['failed']} failed)"
+    )
+    return 0 if summary["failed"] == 0 else -1
 
 
 if __name__ == "__main__":
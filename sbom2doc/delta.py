@@ -0,0 +1,304 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from collections import Counter
+from itertools import zip_longest
+
+from sbom2doc.aggregator import SBOMAggregator
+from sbom2doc.records import PackageRecord
+from sbom2doc.report import Report
+from sbom2doc.version import VERSION
+
+SNAPSHOT_KEY = "sbom2doc-snapshot"
+
+# Attributes compared for packages present in both SBOMs
+ATTRIBUTES = ["version", "type", "supplier", "license", "download", "copyright"]
+
+
+def package_key(record):
+    # Identity of a package independent of its version. The PURL (without
+    # version, qualifiers and subpath) is used if available. The version
+    # follows the name so a namespace (e.g. an npm scope) is retained.
+    if record.purl:
+        namespace, separator, name = (
+            record.purl.split("#")[0].split("?")[0].rpartition("/")
+        )
+        return namespace + separator + name.split("@", 1)[0]
+    return record.name
+
+
+def _record_order(record):
+    return [str(value) for value in record.row()]
+
+
+def _pair(previous, current):
+    # Records of the same package in two SBOMs. Records with the same
+    # version are paired first and the remaining records are then paired in
+    # order. A record without a pair is (None, record) or (record, None).
+    unpaired = list(previous)
+    remaining = []
+    for record in current:
+        for position, previous_record in enumerate(unpaired):
+            if previous_record.version == record.version:
+                yield unpaired.pop(position), record
+                break
+        else:
+            remaining.append(record)
+    yield from zip_longest(unpaired, remaining)
+
+
+class PackageIndex:
+    # Packages of a SBOM indexed by identity together with the summary
+    # counts. Each identity has a list of records (one for each version of
+    # the package) in a fixed order so that an index does not depend on the
+    # order of the packages in the SBOM. An index can be saved as a snapshot
+    # so that a later version of the SBOM can be compared without parsing
+    # the previous SBOM again.
+
+    def __init__(self, name=""):
+        self.name = name
+        self.packages = {}
+        self.counts = None
+
+    def __len__(self):
+        return sum(len(records) for records in self.packages.values())
+
+    def add(self, record):
+        # The index must be sorted once all of the records have been added
+        self.packages.setdefault(package_key(record), []).append(record)
+
+    def sort(self):
+        for records in self.packages.values():
+            if len(records) > 1:
+                records.sort(key=_record_order)
+
+    def records(self):
+        for records in self.packages.values():
+            yield from records
+
+    @classmethod
+    def from_parser(cls, sbom_parser, license_info, name=""):
+        index = cls(name)
+        summary = SBOMAggregator(license_info)
+        for package in sbom_parser.get_packages():
+            index.add(summary.add_package(package))
+        index.sort()
+        return index
+
+    def summary(self):
+        # Counts are only calculated once; they are then maintained by apply
+        if self.counts is None:
+            self.counts = {
+                "type": Counter(),
+                "license": Counter(),
+                "supplier": Counter(),
+            }
+            for record in self.records():
+                self._count(record, 1)
+        return self.counts
+
+    def _count(self, record, change):
+        for attribute, counter in self.counts.items():
+            value = getattr(record, attribute)
+            if value is not None:
+                counter[value] += change
+                if counter[value] == 0:
+                    del counter[value]
+
+    def apply(self, delta):
+        # Update the index and counts to the current version of the SBOM
+        self.summary()
+        for key, record in delta.removed:
+            records = self.packages[key]
+            records.remove(record)
+            if len(records) == 0:
+                del self.packages[key]
+            self._count(record, -1)
+        for key, previous, current, _ in delta.changed:
+            records = self.packages[key]
+            records[records.index(previous)] = current
+            self._count(previous, -1)
+            self._count(current, 1)
+        for key, record in delta.added:
+            self.add(record)
+            self._count(record, 1)
+        self.sort()
+        self.name = delta.name
+
+    def save(self, filename):
+        snapshot = {
+            SNAPSHOT_KEY: VERSION,
+            "name": self.name,
+            "packages": [
+                record.row()
+                for key in sorted(self.packages)
+                for record in self.packages[key]
+            ],
+            "counts": self.summary(),
+        }
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        index = cls(snapshot["name"])
+        for row in snapshot["packages"]:
+            index.add(PackageRecord(*row))
+        index.sort()
+        index.counts = {
+            attribute: Counter(counts)
+            for attribute, counts in snapshot["counts"].items()
+        }
+        return index
+
+
+def is_snapshot(filename):
+    # Snapshots are written with the snapshot key first
+    with open(filename, "rb") as f:
+        start = f.read(len(SNAPSHOT_KEY) + 3)
+    return start == f'{{"{SNAPSHOT_KEY}"'.encode("utf-8")
+
+
+class Delta:
+    # Differences between two package indexes. Each package is looked up
+    # once in the other index so the comparison is linear in the number of
+    # packages. If a package has more than one version, the versions are
+    # paired explicitly.
+
+    def __init__(self, previous, current):
+        self.name = current.name
+        self.added = []
+        self.removed = []
+        self.changed = []
+        self.unchanged = 0
+        for key, records in current.packages.items():
+            for previous_record, record in _pair(
+                previous.packages.get(key, []), records
+            ):
+                if previous_record is None:
+                    self.added.append((key, record))
+                elif record is None:
+                    self.removed.append((key, previous_record))
+                else:
+                    self._compare(key, previous_record, record)
+        for key, records in previous.packages.items():
+            if key not in current.packages:
+                self.removed.extend((key, record) for record in records)
+
+    def _compare(self, key, previous_record, record):
+        differences = [
+            [
+                attribute,
+                getattr(previous_record, attribute),
+                getattr(record, attribute),
+            ]
+            for attribute in ATTRIBUTES
+            if getattr(previous_record, attribute) != getattr(record, attribute)
+        ]
+        if len(differences) > 0:
+            self.changed.append((key, previous_record, record, differences))
+        else:
+            self.unchanged += 1
+
+
+def _package_table(report, packages):
+    report.createtable(
+        ["Name", "Version", "Type", "Supplier", "License", "PURL"],
+        [12, 8, 8, 12, 12],
+    )
+    for _, record in sorted(packages, key=lambda package: package[0]):
+        report.addrow(
+            [
+                record.name,
+                record.version,
+                record.type,
+                record.supplier,
+                record.license,
+                record.purl,
+            ]
+        )
+    report.showtable(widths=[4, 2, 2, 3, 3, 4])
+
+
+def _count_table(report, title, previous, current):
+    changes = [
+        [key, str(previous.get(key, 0)), str(current.get(key, 0))]
+        for key in sorted(set(previous) | set(current), key=str)
+        if previous.get(key, 0) != current.get(key, 0)
+    ]
+    if len(changes) == 0:
+        return 0
+    report.heading(1, f"{title} Changes")
+    report.createtable([title, "Previous", "Current", "Change"], [25, 6, 6, 6])
+    for key, before, after in changes:
+        report.addrow([key, before, after, f"{int(after) - int(before):+d}"])
+    report.showtable(widths=[10, 3, 3, 3])
+    return len(changes)
+
+
+def build_delta_report(previous, current, profiler):
+    # The previous index is updated to the current SBOM
+    with profiler.phase("delta") as phase:
+        delta = Delta(previous, current)
+        phase["rows"] = len(current) + len(previous)
+    previous_name = previous.name
+    previous_count = len(previous)
+    before = {
+        attribute: Counter(counts) for attribute, counts in previous.summary().items()
+    }
+    with profiler.phase("delta_summary"):
+        previous.apply(delta)
+        after = previous.summary()
+
+    report = Report()
+    with profiler.phase("summary") as phase:
+        report.heading(1, "SBOM Delta Summary")
+        report.createtable(["Item", "Details"], [20, 35])
+        report.addrow(["Previous SBOM", previous_name])
+        report.addrow(["Current SBOM", current.name])
+        report.addrow(["Previous Packages", str(previous_count)])
+        report.addrow(["Current Packages", str(len(previous))])
+        report.addrow(["Added", str(len(delta.added))])
+        report.addrow(["Removed", str(len(delta.removed))])
+        report.addrow(["Changed", str(len(delta.changed))])
+        report.addrow(["Unchanged", str(delta.unchanged)])
+        report.showtable(widths=[5, 9])
+        phase["rows"] = 8
+
+    if len(delta.added) > 0:
+        with profiler.phase("added") as phase:
+            report.heading(1, "Added Packages")
+            _package_table(report, delta.added)
+            phase["rows"] = len(delta.added)
+
+    if len(delta.removed) > 0:
+        with profiler.phase("removed") as phase:
+            report.heading(1, "Removed Packages")
+            _package_table(report, delta.removed)
+            phase["rows"] = len(delta.removed)
+
+    if len(delta.changed) > 0:
+        with profiler.phase("changed") as phase:
+            report.heading(1, "Changed Packages")
+            report.createtable(["Name", "Attribute", "Previous", "Current"], [12])
+            for _, _, record, differences in sorted(
+                delta.changed, key=lambda package: package[0]
+            ):
+                for attribute, before_value, after_value in differences:
+                    report.addrow([record.name, attribute, before_value, after_value])
+                    phase["rows"] += 1
+            report.showtable(widths=[4, 2, 4, 4])
+
+    with profiler.phase("count_changes") as phase:
+        for attribute, title in [
+            ("type", "Component Type"),
+            ("license", "License"),
+            ("supplier", "Supplier"),
+        ]:
+            phase["rows"] += _count_table(
+                report, title, before[attribute], after[attribute]
+            )
+    return report
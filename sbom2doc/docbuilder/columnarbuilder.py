@@ -0,0 +1,96 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+from lib4sbom.output import SBOMOutput
+
+from sbom2doc.docbuilder.docbuilder import DocBuilder
+from sbom2doc.docbuilder.serializer import dumps
+
+
+class ColumnarJSONBuilder(DocBuilder):
+    # Each section is an object containing the column names of the table
+    # and the rows as arrays, e.g.
+    #
+    #   {"sbom_summary":{"columns":["item","details"],"rows":[
+    #   ["SBOM File","flask.spdx"]
+    #   ,["SBOM Type","spdx"]
+    #   ]}
+    #   }
+    #
+    # One row is written per line so the document can be streamed.
+    streaming = True
+
+    def __init__(self, backend=None):
+        self.json_document = []
+        self.backend = backend
+        self.section_open = False
+        self.first_section = True
+        self.members = 0
+        self.first_row = True
+        self.text = []
+
+    def _attribute(self, name):
+        return name.lower().replace(" ", "_")
+
+    def _output(self, text):
+        if self.stream is not None:
+            self.write(text)
+        else:
+            self.json_document.append(text)
+
+    def _close_section(self):
+        if not self.section_open:
+            return
+        if len(self.text) > 0:
+            separator = "," if self.members > 0 else ""
+            self._output(f'{separator}"text":{dumps(self.text, self.backend)}')
+        self._output("}")
+        self.section_open = False
+        self.text = []
+
+    def heading(self, level, title, number=True):
+        self._close_section()
+        separator = "{" if self.first_section else ","
+        self._output(f"{separator}{dumps(self._attribute(title), self.backend)}:{{")
+        self.section_open = True
+        self.first_section = False
+        self.members = 0
+
+    def paragraph(self, text):
+        if not self.section_open:
+            self.heading(1, "Text")
+        self.text.append(text)
+
+    def createtable(self, header, validate=None):
+        # Layout is [headings, ....]
+        if not self.section_open:
+            self.heading(1, "Table")
+        columns = [self._attribute(h) for h in header]
+        separator = "," if self.members > 0 else ""
+        self._output(f'{separator}"columns":{dumps(columns, self.backend)},"rows":[')
+        self.members += 1
+        self.first_row = True
+
+    def addrow(self, data):
+        # Add row to table
+        row = dumps(["" if d is None else d for d in data], self.backend)
+        if self.first_row:
+            self._output(row)
+            self.first_row = False
+        else:
+            self._output(f",{row}")
+
+    def showtable(self, widths=None):
+        self._output("]")
+        self.flush_stream()
+
+    def publish(self, filename):
+        self._close_section()
+        if self.first_section:
+            self._output("{")
+        self._output("}")
+        if self.stream is not None:
+            self.close_stream()
+            return
+        json_doc = SBOMOutput(filename=filename)
+        json_doc.generate_output(self.json_document)
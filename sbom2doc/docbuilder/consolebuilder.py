@@ -1,33 +1,120 @@
 # Copyright (C) 2023 Anthony Harrison
 # SPDX-License-Identifier: Apache-2.0
 
-from rich import print
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
+from rich.table import Column, Table
 
 from sbom2doc.docbuilder.docbuilder import DocBuilder
 
 
 class ConsoleBuilder(DocBuilder):
+    # Number of rows of a large table shown in high volume mode
+    max_rows = 100
+    # Maximum width of a column in high volume mode
+    max_column_width = 40
+
     def __init__(self):
-        pass
+        # All output is written using the same console
+        self.console = Console()
+        self.table = None
+        self.header = []
+        self.rows = []
+        self.row_count = 0
+
+    def _plain(self):
+        # Plain text is written if output is not to a terminal
+        return self.high_volume and not self.console.is_terminal
+
+    def _write(self, text):
+        self.console.file.write(text + "\n")
 
     def heading(self, level, title, number=True):
-        print(Panel(title, style="bold", expand=False))
+        if self._plain():
+            self._write(f"\n{title}\n{('=' if level == 1 else '-') * len(title)}")
+        else:
+            self.console.print(Panel(title, style="bold", expand=False))
 
     def paragraph(self, text):
-        print(f"\n{text}")
+        if self._plain():
+            self._write(f"\n{text}")
+        else:
+            self.console.print(f"\n{text}")
 
     def createtable(self, header, validate=None):
         # Layout is [headings, ....]
-        self.table = Table()
-        for h in header:
-            self.table.add_column(h)
+        if self.high_volume:
+            # Only the first rows of a table are retained
+            self.header = header
+            self.rows = []
+            self.row_count = 0
+        else:
+            self.table = Table()
+            for h in header:
+                self.table.add_column(h)
 
     def addrow(self, data):
-        self.table.add_row(*data)
+        if self.high_volume:
+            if self.row_count < self.max_rows:
+                self.rows.append(["" if d is None else str(d) for d in data])
+            self.row_count += 1
+        else:
+            self.table.add_row(*data)
+
+    def _column_widths(self):
+        # Calculated once from the retained rows so that the contents of the
+        # table do not need to be measured when the table is rendered
+        widths = [len(h) for h in self.header]
+        for row in self.rows:
+            for column, value in enumerate(row):
+                widths[column] = max(widths[column], len(value))
+        return [min(width, self.max_column_width) for width in widths]
+
+    def _cell(self, value, width):
+        # Values are shown on a single line and truncated to the width of
+        # the column so that the following columns remain aligned
+        value = " ".join(value.splitlines())
+        if len(value) > width:
+            value = value[: width - 3] + "..."
+        return value.ljust(width)
+
+    def _show_plain(self, widths):
+        lines = [
+            "  ".join(self._cell(h, w) for h, w in zip(self.header, widths)).rstrip(),
+            "  ".join("-" * w for w in widths),
+        ]
+        for row in self.rows:
+            lines.append(
+                "  ".join(
+                    self._cell(value, w) for value, w in zip(row, widths)
+                ).rstrip()
+            )
+        self._write("\n".join(lines))
+
+    def _show_table(self, widths):
+        table = Table(
+            *[Column(h, width=w) for h, w in zip(self.header, widths)],
+        )
+        for row in self.rows:
+            table.add_row(*row)
+        self.console.print(table)
 
     def showtable(self, widths=None):
-        console = Console()
-        console.print(self.table)
+        if not self.high_volume:
+            self.console.print(self.table)
+            return
+        column_widths = self._column_widths()
+        if self._plain():
+            self._show_plain(column_widths)
+        else:
+            self._show_table(column_widths)
+        if self.row_count > len(self.rows):
+            message = (
+                f"Showing {len(self.rows)} of {self.row_count} rows. "
+                "Use another format for the complete table."
+            )
+            if self._plain():
+                self._write(message)
+            else:
+                self.console.print(message, style="italic")
+        self.rows = []
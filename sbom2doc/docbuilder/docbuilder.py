@@ -1,8 +1,16 @@
 # Copyright (C) 2023 Anthony Harrison
 # SPDX-License-Identifier: Apache-2.0
 
+import sys
+
 
 class DocBuilder:
+    # Set by builders which can write content as it is produced
+    streaming = False
+    stream = None
+    # Set if output is to be optimised for very large documents
+    high_volume = False
+
     def __init__(self):
         pass
 
@@ -26,3 +34,30 @@ class DocBuilder:
 
     def pagebreak(self):
         pass
+
+    def set_high_volume(self, high_volume=True):
+        self.high_volume = high_volume
+
+    def open_stream(self, filename):
+        # Content is written directly to the output rather than being
+        # retained until the document is published
+        if filename == "":
+            self.stream = sys.stdout
+        else:
+            try:
+                self.stream = open(filename, "w", encoding="utf-8")
+            except FileNotFoundError:
+                # Unable to create file, so send output to console
+                self.stream = sys.stdout
+
+    def write(self, text):
+        self.stream.write(text + "\n")
+
+    def flush_stream(self):
+        if self.stream is not None:
+            self.stream.flush()
+
+    def close_stream(self):
+        if self.stream is not None and self.stream is not sys.stdout:
+            self.stream.close()
+        self.stream = None
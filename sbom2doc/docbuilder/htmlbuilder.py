@@ -1,50 +1,162 @@
 # Copyright (C) 2023 Anthony Harrison
 # SPDX-License-Identifier: Apache-2.0
 
+import html
+import json
+
 from lib4sbom.output import SBOMOutput
 
 from sbom2doc.docbuilder.docbuilder import DocBuilder
 
+# Shows a page of a table from the row data held in JSON chunks. Chunks
+# are only parsed when the page is displayed.
+TABLE_SCRIPT = """<script>
+function sbom2docTable(id, count) {
+  var table = document.getElementById(id);
+  var chunks = document.querySelectorAll("script[data-table='" + id + "']");
+  var status = document.getElementById(id + "-page");
+  var page = 0;
+  function show(n) {
+    page = Math.max(0, Math.min(n, chunks.length - 1));
+    var rows = JSON.parse(chunks[page].textContent);
+    var body = table.tBodies[0];
+    body.textContent = "";
+    for (var i = 0; i < rows.length; i++) {
+      var row = body.insertRow();
+      for (var j = 0; j < rows[i].length; j++) {
+        row.insertCell().textContent = rows[i][j];
+      }
+    }
+    status.textContent = "Page " + (page + 1) + " of " + chunks.length +
+      " (" + count + " rows)";
+  }
+  document.getElementById(id + "-prev").onclick = function () { show(page - 1); };
+  document.getElementById(id + "-next").onclick = function () { show(page + 1); };
+  show(0);
+}
+</script>"""
+
 
 class HTMLBuilder(DocBuilder):
+    streaming = True
+    # Number of rows in each page of a large table in high volume mode
+    page_rows = 100
+
     def __init__(self, style=None):
         self.html_document = []
+        self.table_count = 0
+        self.table_header = []
+        self.table_rows = []
+        self.table_id = None
+        self.row_count = 0
+
+    def _output(self, text):
+        if self.stream is not None:
+            self.write(text)
+        else:
+            self.html_document.append(text)
+
+    def _escape(self, value):
+        return html.escape(str(value)) if value is not None else ""
 
     def heading(self, level, title, number=True):
-        self.html_document.append(f"\n<h{level}>{title}</h{level}>\n")
+        self._output(f"\n<h{level}>{self._escape(title)}</h{level}>\n")
 
     def paragraph(self, text):
-        self.html_document.append(f"<p>{text}</p>")
+        # Text may contain markup (e.g. license text)
+        self._output(f"<p>{text}</p>")
+
+    def _table_start(self, table_id=None):
+        attributes = f" id='{table_id}'" if table_id is not None else ""
+        self._output(
+            f"<table class='table table-striped table-bordered'{attributes}>\n"
+        )
+        self._output("<thead><tr>\n")
+        for d in self.table_header:
+            self._output(f"<th scope='col'>{self._escape(d)}</th>\n")
+        self._output("</tr>\n")
+        self._output("</thead><tbody class='table-group-divider'>\n")
 
     def createtable(self, header, validate=None):
         # Layout is [headings, ....]
-        self.html_document.append("<table class='table table-striped table-bordered'>\n")
+        self.table_header = header
+        if self.high_volume:
+            # Output is deferred until the size of the table is known
+            self.table_rows = []
+            self.table_id = None
+            self.row_count = 0
+        else:
+            self._table_start()
+
+    def _row(self, data):
+        self._output("<tr>\n")
+        for d in data:
+            self._output(f"<td>{self._escape(d)}</td>\n")
+        self._output("</tr>\n")
 
-        #table_headings = " | ".join(h for h in header)
+    def _chunk(self, rows):
+        data = json.dumps(rows, separators=(",", ":"), ensure_ascii=False)
+        # Prevent the data from closing the script element
+        data = data.replace("<", "\\u003c")
+        self._output(
+            f"<script type='application/json' data-table='{self.table_id}'>"
+            f"{data}</script>\n"
+        )
+        self.flush_stream()
 
-        self.html_document.append("<thead><tr>\n")
-        for d in header:
-            self.html_document.append(f"<th scope='col'>{d}</th>\n")
-        self.html_document.append("</tr>\n")
-        self.html_document.append("</thead><tbody class='table-group-divider'>\n")
+    def _paged_table(self):
+        # Rows are held as JSON rather than table rows
+        self.table_count += 1
+        self.table_id = f"sbom2doc-table-{self.table_count}"
+        if self.table_count == 1:
+            self._output(TABLE_SCRIPT + "\n")
+        self._table_start(self.table_id)
+        self._output("</tbody></table>\n")
 
     def addrow(self, data):
         # Add row to table
-        my_data = []
-        for d in data:
-            if d is not None:
-                my_data.append(d)
-            else:
-                my_data.append("")
-        # table_row = " | ".join(d for d in my_data)
-        self.html_document.append("<tr>\n")
-        for d in my_data:
-            self.html_document.append(f"<td>{d}</td>\n")
-        self.html_document.append("</tr>\n")
+        if self.high_volume:
+            self.table_rows.append(["" if d is None else str(d) for d in data])
+            self.row_count += 1
+            if len(self.table_rows) > self.page_rows:
+                if self.table_id is None:
+                    self._paged_table()
+                self._chunk(self.table_rows[: self.page_rows])
+                self.table_rows = self.table_rows[self.page_rows :]
+            return
+        self._row(data)
 
     def showtable(self, widths=None):
-        self.html_document.append("</tbody></table>\n")
+        if self.high_volume and self.table_id is None:
+            # Small tables are included in the page
+            self._table_start()
+            for row in self.table_rows:
+                self._row(row)
+            self.table_rows = []
+        elif self.high_volume:
+            if len(self.table_rows) > 0:
+                self._chunk(self.table_rows)
+                self.table_rows = []
+            table_id = self.table_id
+            self._output(
+                f"<nav><button type='button' class='btn btn-outline-secondary "
+                f"btn-sm' id='{table_id}-prev'>Previous</button>\n"
+                f"<span id='{table_id}-page'></span>\n"
+                f"<button type='button' class='btn btn-outline-secondary "
+                f"btn-sm' id='{table_id}-next'>Next</button></nav>\n"
+            )
+            self._output(
+                f"<script>sbom2docTable('{table_id}', {self.row_count});</script>\n"
+            )
+            self.table_id = None
+            self.flush_stream()
+            return
+        self._output("</tbody></table>\n")
+        self.flush_stream()
 
     def publish(self, filename):
+        if self.stream is not None:
+            self.close_stream()
+            return
         html_doc = SBOMOutput(filename=filename)
         html_doc.generate_output(self.html_document)
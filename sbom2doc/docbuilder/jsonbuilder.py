@@ -1,28 +1,79 @@
 # Copyright (C) 2023 Anthony Harrison
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+import shutil
+from tempfile import SpooledTemporaryFile
+
 from lib4sbom.output import SBOMOutput
 
 from sbom2doc.docbuilder.docbuilder import DocBuilder
 
 
 class JSONBuilder(DocBuilder):
+    streaming = True
+    # Size of the rows of an element held in memory when streaming
+    SPOOL_SIZE = 1 << 20
+
     def __init__(self):
         self.json_document = {}
         self.element = ["", ""]
         self.element_data = []
         self.attribute_headings = []
+        self.rows = None
+        self.first_element = True
+        self.first_row = True
 
     def _attribute(self, name):
         return name.lower().replace(" ", "_")
 
+    def _indent(self, text, level):
+        padding = " " * level
+        return "\n".join(f"{padding}{line}" for line in text.splitlines())
+
+    def open_stream(self, filename):
+        super().open_stream(filename)
+        self.stream.write("{")
+        self._spool_rows()
+
+    def _spool_rows(self):
+        # The element to which rows belong is only known when the next heading
+        # of the same level is added, so rows are spooled until then
+        if self.rows is not None:
+            self.rows.close()
+        self.rows = SpooledTemporaryFile(
+            max_size=self.SPOOL_SIZE, mode="w+", encoding="utf-8"
+        )
+        self.first_row = True
+
+    def _stream_element(self, name):
+        separator = "\n" if self.first_element else ",\n"
+        self.stream.write(f"{separator}  {json.dumps(self._attribute(name))}: [")
+        if not self.first_row:
+            self.rows.seek(0)
+            shutil.copyfileobj(self.rows, self.stream)
+            self.stream.write("\n  ")
+        self.stream.write("]")
+        self.first_element = False
+        self.flush_stream()
+
     def heading(self, level, title, number=True):
+        # Rows are added to the previous element with the same level. This
+        # is applied in the same way when streaming so that the document is
+        # the same in both modes (a repeated element is written again when
+        # streaming and the last value is used when the document is read).
         if self.element[level - 1] != "":
-            self.json_document[self._attribute(self.element[level - 1])] = (
-                self.element_data
-            )
+            if self.stream is not None:
+                self._stream_element(self.element[level - 1])
+            else:
+                self.json_document[self._attribute(self.element[level - 1])] = (
+                    self.element_data
+                )
         self.element[level - 1] = title
-        self.element_data = []
+        if self.stream is not None:
+            self._spool_rows()
+        else:
+            self.element_data = []
 
     def createtable(self, header, validate=None):
         # Layout is [headings, ....]
@@ -39,10 +90,23 @@ class JSONBuilder(DocBuilder):
             else:
                 my_data[element] = ""
             index = index + 1
-        self.element_data.append(my_data)
+        if self.stream is not None:
+            separator = "\n" if self.first_row else ",\n"
+            row = self._indent(json.dumps(my_data, indent=2), 4)
+            self.rows.write(separator + row)
+            self.first_row = False
+        else:
+            self.element_data.append(my_data)
 
     def publish(self, filename):
         # Force last set of data to be added to document
         self.heading(1, "dummy")
+        if self.stream is not None:
+            self.rows.close()
+            self.rows = None
+            self.stream.write("\n}" if not self.first_element else "}")
+            self.stream.write("\n")
+            self.close_stream()
+            return
         json_doc = SBOMOutput(filename=filename, output_format="json")
         json_doc.generate_output(self.json_document)
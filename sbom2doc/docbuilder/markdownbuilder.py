@@ -7,22 +7,30 @@ from sbom2doc.docbuilder.docbuilder import DocBuilder
 
 
 class MarkdownBuilder(DocBuilder):
+    streaming = True
+
     def __init__(self):
         self.markdown_document = []
 
+    def _output(self, text):
+        if self.stream is not None:
+            self.write(text)
+        else:
+            self.markdown_document.append(text)
+
     def heading(self, level, title, number=True):
         heading_field = "#" * level
-        self.markdown_document.append(f"\n{heading_field} {title}\n")
+        self._output(f"\n{heading_field} {title}\n")
 
     def paragraph(self, text):
-        self.markdown_document.append(f"{text}")
+        self._output(f"{text}")
 
     def createtable(self, header, validate=None):
         # Layout is [headings, ....]
         table_headings = " | ".join(h for h in header)
         table_header = "| -------- " * len(header)
-        self.markdown_document.append(table_headings)
-        self.markdown_document.append(table_header)
+        self._output(table_headings)
+        self._output(table_header)
 
     def addrow(self, data):
         # Add row to table
@@ -33,8 +41,14 @@ class MarkdownBuilder(DocBuilder):
             else:
                 my_data.append("")
         table_row = " | ".join(d for d in my_data)
-        self.markdown_document.append(table_row)
+        self._output(table_row)
+
+    def showtable(self, widths=None):
+        self.flush_stream()
 
     def publish(self, filename):
+        if self.stream is not None:
+            self.close_stream()
+            return
         markdown_doc = SBOMOutput(filename=filename)
         markdown_doc.generate_output(self.markdown_document)
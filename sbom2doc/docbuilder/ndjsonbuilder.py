@@ -0,0 +1,57 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+from lib4sbom.output import SBOMOutput
+
+from sbom2doc.docbuilder.docbuilder import DocBuilder
+from sbom2doc.docbuilder.serializer import dumps
+
+
+class NDJSONBuilder(DocBuilder):
+    # Newline delimited JSON. Each table starts with an object containing
+    # the section and column names and is followed by one array per row.
+    # Paragraphs are objects containing the section and text e.g.
+    #
+    #   {"section":"sbom_summary","columns":["item","details"]}
+    #   ["SBOM File","flask.spdx"]
+    #   {"section":"ntia_summary","text":"NTIA conformant True"}
+    streaming = True
+
+    def __init__(self, backend=None):
+        self.json_document = []
+        self.backend = backend
+        self.section = ""
+
+    def _attribute(self, name):
+        return name.lower().replace(" ", "_")
+
+    def _output(self, text):
+        if self.stream is not None:
+            self.write(text)
+        else:
+            self.json_document.append(text)
+
+    def heading(self, level, title, number=True):
+        self.section = self._attribute(title)
+
+    def paragraph(self, text):
+        self._output(dumps({"section": self.section, "text": text}, self.backend))
+
+    def createtable(self, header, validate=None):
+        # Layout is [headings, ....]
+        columns = [self._attribute(h) for h in header]
+        self._output(dumps({"section": self.section, "columns": columns}, self.backend))
+
+    def addrow(self, data):
+        # Add row to table
+        self._output(dumps(["" if d is None else d for d in data], self.backend))
+
+    def showtable(self, widths=None):
+        self.flush_stream()
+
+    def publish(self, filename):
+        if self.stream is not None:
+            self.close_stream()
+            return
+        json_doc = SBOMOutput(filename=filename)
+        json_doc.generate_output(self.json_document)
@@ -3,7 +3,6 @@
 
 from reportlab import rl_config
 from reportlab.lib import colors
-from reportlab.lib.styles import ListStyle
 from reportlab.lib.styles import ParagraphStyle as PS
 from reportlab.lib.units import cm
 from reportlab.platypus import PageBreak, Spacer, TableStyle
@@ -35,6 +34,39 @@ class ConditionalSpacer(Spacer):
         return (availWidth, height)
 
 
+class NoteRegistry:
+    # Notes are numbered in the order in which they are first added. The
+    # index avoids searching the list of notes for every cell.
+
+    def __init__(self):
+        self.notes = []
+        self.index = {}
+        # Number of notes already included in the document
+        self.reported = 0
+
+    def add(self, text):
+        number = self.index.get(text)
+        if number is None:
+            self.notes.append(text)
+            number = len(self.notes)
+            self.index[text] = number
+        return number
+
+    def new_notes(self):
+        # Notes which have not yet been included in the document
+        start = self.reported
+        self.reported = len(self.notes)
+        return start + 1, self.notes[start:]
+
+    def clear(self):
+        self.notes = []
+        self.index = {}
+        self.reported = 0
+
+    def __len__(self):
+        return len(self.notes)
+
+
 class PDFBuilder(DocBuilder):
 
     document_font = "Helvetica"
@@ -48,6 +80,15 @@ class PDFBuilder(DocBuilder):
 
     spacer = ConditionalSpacer(0.25 * cm, 0.25 * cm)
 
+    # Width of frame used by SimpleDocTemplate (A4 with 1 inch margins)
+    page_width = 21 * cm - 2 * 2.54 * cm
+
+    # Number of rows in each table in high volume mode
+    chunk_rows = 30
+    # Height of a line of text (font size 12) and cell padding in a table row
+    row_leading = 14.4
+    row_padding = 6
+
     tblStyle = TableStyle(
         [
             ("INNERGRID", (0, 0), (-1, -1), 0.25, black),
@@ -57,31 +98,22 @@ class PDFBuilder(DocBuilder):
         ]
     )
 
-    list = ListStyle(
+    list = PS(
         name="list",
         fontSize=10,
         fontName=document_font,
         leading=12,
         textColor=black,
-        textTransform=None,
         firstLineIndent=12,
-        wordWrap=True,
-        uriWasteReduce=None,
-        embeddedHyphenation=True,
-        spaceShrinkage=True,
         splitLongWords=True,
-        justifyBreaks=True,
-        justifyLastLine=False,
-        endDots=False,
         backColor=colors.white,
-        alignment=False,
     )
 
     def __init__(self):
         self.contents = []
         self.headingnumber = [0, 0, 0, 0]
         self.table_data = []
-        self.note_data = []
+        self.note_data = NoteRegistry()
         self.table_validation = None
         # Set default configuration parameters
         rl_config.trustedHosts = ["localhost", "127.0.0.1"]
@@ -145,14 +177,12 @@ class PDFBuilder(DocBuilder):
         i = 0
         newdata = []
         for d in data:
-            if self.table_validation[i] is not None:
+            if i < len(self.table_validation) and self.table_validation[i] is not None:
                 # Column size validation
                 if d is None:
                     newdata.append("")
                 elif len(d) > self.table_validation[i]:
-                    if d not in self.note_data:
-                        self.note_data.append(d)
-                    newdata.append("Note " + str(self.note_data.index(d) + 1))
+                    newdata.append("Note " + str(self.note_data.add(d)))
                 else:
                     newdata.append(d)
             else:
@@ -164,22 +194,70 @@ class PDFBuilder(DocBuilder):
         # Add row to table
         self.table_data.append(self._validatedata(data))
 
+    def _column_widths(self, widths, columns):
+        # Columns without a specified width share the remaining page width
+        colwidths = [w * cm for w in widths[:columns]]
+        if len(colwidths) < columns:
+            remaining = max(
+                self.page_width - sum(colwidths), cm * (columns - len(colwidths))
+            )
+            colwidths += [remaining / (columns - len(colwidths))] * (
+                columns - len(colwidths)
+            )
+        return colwidths
+
+    def _row_height(self, row):
+        # Precomputed to avoid measuring every cell
+        lines = max([str(d).count("\n") + 1 for d in row if d is not None], default=1)
+        return lines * self.row_leading + self.row_padding
+
+    def _chunked_tables(self, colwidths):
+        # Page sized tables avoid the cost of splitting a single large table
+        # across pages. Each table repeats the header row.
+        header = self.table_data[:1]
+        rows = self.table_data[1:]
+        for start in range(0, max(len(rows), 1), self.chunk_rows):
+            chunk = header + rows[start : start + self.chunk_rows]
+            tbl = Table(
+                chunk,
+                colWidths=colwidths,
+                rowHeights=[self._row_height(row) for row in chunk],
+                repeatRows=1,
+            )
+            tbl.setStyle(self.table_style)
+            self.contents.append(tbl)
+
     def showtable(self, widths=None):
-        colwidths = [w * cm for w in widths]
         self._spacer()
-        tbl = Table(self.table_data, colWidths=colwidths, repeatRows=1)
-        tbl.setStyle(self.table_style)
-        self.contents.append(tbl)
+        if self.high_volume:
+            columns = len(self.table_data[0]) if len(self.table_data) > 0 else 0
+            self._chunked_tables(self._column_widths(widths or [], columns))
+        else:
+            colwidths = [w * cm for w in widths]
+            tbl = Table(self.table_data, colWidths=colwidths, repeatRows=1)
+            tbl.setStyle(self.table_style)
+            self.contents.append(tbl)
+        self.table_data = []
         self.table_ident = None
-        # Optional notes if data in columns truncated
-        if len(self.note_data) > 0:
+        # Optional notes if data in columns truncated. In high volume mode
+        # notes are shared by all tables so each note is only included once.
+        first, new_notes = self.note_data.new_notes()
+        if len(new_notes) > 0:
             notes = ["<br/><u>Notes</u><br/><ul>"]
-            i = 1
-            for d in self.note_data:
+            i = first
+            for d in new_notes:
                 notes.append(f"<li>{str(i):>4} . {d}</li>")
                 i += 1
-            self._notes_paragraph("</ul><br/>".join(notes))
-            self.note_data = []
+            if self.high_volume:
+                # A single large paragraph is expensive to split across pages
+                for start in range(0, len(notes), self.chunk_rows):
+                    self._notes_paragraph(
+                        "</ul><br/>".join(notes[start : start + self.chunk_rows])
+                    )
+            else:
+                self._notes_paragraph("</ul><br/>".join(notes))
+        if not self.high_volume:
+            self.note_data.clear()
         self._spacer()
 
     def pagebreak(self):
@@ -0,0 +1,87 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import importlib
+
+# Builders are only imported when their format is selected. Additional
+# builders can be provided by other packages using the entry point group
+# below e.g.
+#
+#   entry_points={"sbom2doc.builders": ["csv = mypackage.csvbuilder:CSVBuilder"]}
+
+ENTRY_POINT_GROUP = "sbom2doc.builders"
+
+DEFAULT_FORMAT = "console"
+
+BUILDERS = {
+    "console": "sbom2doc.docbuilder.consolebuilder:ConsoleBuilder",
+    "excel": "sbom2doc.docbuilder.spreadsheetbuilder:SpreadsheetBuilder",
+    "html": "sbom2doc.docbuilder.htmlbuilder:HTMLBuilder",
+    "json": "sbom2doc.docbuilder.jsonbuilder:JSONBuilder",
+    "json-columnar": "sbom2doc.docbuilder.columnarbuilder:ColumnarJSONBuilder",
+    "markdown": "sbom2doc.docbuilder.markdownbuilder:MarkdownBuilder",
+    "ndjson": "sbom2doc.docbuilder.ndjsonbuilder:NDJSONBuilder",
+    "pdf": "sbom2doc.docbuilder.pdfbuilder:PDFBuilder",
+}
+
+_plugins = None
+
+
+def _entry_points():
+    global _plugins
+    if _plugins is None:
+        _plugins = {}
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            # Python 3.7
+            return _plugins
+        eps = entry_points()
+        if hasattr(eps, "select"):
+            eps = eps.select(group=ENTRY_POINT_GROUP)
+        else:
+            eps = eps.get(ENTRY_POINT_GROUP, [])
+        for ep in eps:
+            _plugins[ep.name] = ep.value
+    return _plugins
+
+
+def register_builder(format, builder):
+    # Builder is either a class or a "module:class" reference
+    BUILDERS[format] = builder
+
+
+def get_formats(plugins=True):
+    formats = set(BUILDERS)
+    if plugins:
+        formats.update(_entry_points())
+    return sorted(formats)
+
+
+def is_format(format):
+    # Avoid searching for plugins unless necessary
+    return format in BUILDERS or format in _entry_points()
+
+
+def _load(reference):
+    module_name, _, class_name = reference.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_builder(format):
+    if format not in BUILDERS:
+        if format in _entry_points():
+            BUILDERS[format] = _entry_points()[format]
+        else:
+            # Unknown formats are sent to the console
+            format = DEFAULT_FORMAT
+    builder = BUILDERS[format]
+    if isinstance(builder, str):
+        # Only import once
+        builder = _load(builder)
+        BUILDERS[format] = builder
+    return builder
+
+
+def create_builder(format):
+    return get_builder(format)()
@@ -0,0 +1,22 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    # Optional faster serializer
+    orjson = None
+
+BACKENDS = ["orjson", "json"] if orjson is not None else ["json"]
+
+DEFAULT_BACKEND = BACKENDS[0]
+
+
+def dumps(value, backend=None):
+    # Compact JSON. Both backends produce identical output for the strings,
+    # lists and dictionaries used in documents.
+    if (backend or DEFAULT_BACKEND) == "orjson":
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
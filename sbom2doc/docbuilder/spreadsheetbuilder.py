@@ -2,40 +2,65 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
 
 from sbom2doc.docbuilder.docbuilder import DocBuilder
 
+# Maximum length of a worksheet title allowed by Excel
+MAX_TITLE_LENGTH = 31
+
 
 class SpreadsheetBuilder(DocBuilder):
+    header_font = Font(bold=True)
+
     def __init__(self):
         self.workbook_document = Workbook()
         self.worksheet = self.workbook_document.active
         self.worksheet_data = []
         self.table_width = 0
+        self.table_rows = 0
         self.headingcount = 0
         self.heading_title = None
 
+    def set_high_volume(self, high_volume=True):
+        # Rows are written directly to a write-only workbook rather than
+        # being held in memory
+        super().set_high_volume(high_volume)
+        if high_volume:
+            self.workbook_document = Workbook(write_only=True)
+            self.worksheet = None
+
     def heading(self, level, title, number=True):
         self._flush_table()
         self.heading_title = title
 
     def _flush_table(self):
-        if len(self.worksheet_data) > 0:
+        # Rows are not retained in high volume mode so check for an open
+        # table rather than for pending rows
+        if self.table_width > 0:
             # flush table
             self.showtable()
 
     def _heading(self, title):
         # Optionally create new worksheet
-        sheet_title = f"{self.headingcount} - {title}"
-        if self.headingcount > 0:
+        title = title[:MAX_TITLE_LENGTH]
+        sheet_title = f"{self.headingcount} - {title}"[:MAX_TITLE_LENGTH]
+        if self.high_volume:
+            if self.headingcount == 0:
+                sheet_title = title
+            self.worksheet = self.workbook_document.create_sheet(sheet_title)
+            self.headingcount += 1
+        elif self.headingcount > 0:
             self.worksheet = self.workbook_document.create_sheet(sheet_title)
             self.headingcount += 1
         else:
             # Name current sheet
             self.worksheet.title = title
             self.headingcount = 1
-        self.workbook_document.active = self.worksheet
+        if not self.high_volume:
+            self.workbook_document.active = self.worksheet
         self.worksheet_data = []
 
     def paragraph(self, text):
@@ -43,12 +68,26 @@ class SpreadsheetBuilder(DocBuilder):
             if self.table_width == 0:
                 # Create pseudo table
                 self.createtable(["Text"])
-            self.worksheet_data.append([text])
+            if self.high_volume:
+                self.addrow([text])
+            else:
+                self.worksheet_data.append([text])
 
     def createtable(self, header, validate=None):
         self._heading(self.heading_title)
-        self.worksheet_data.append(header)
         self.table_width = len(header)
+        if self.high_volume:
+            # Freeze header row. Must be set before any rows are written.
+            self.worksheet.freeze_panes = "A2"
+            header_row = []
+            for h in header:
+                cell = WriteOnlyCell(self.worksheet, value=h)
+                cell.font = self.header_font
+                header_row.append(cell)
+            self.worksheet.append(header_row)
+            self.table_rows = 1
+        else:
+            self.worksheet_data.append(header)
 
     def addrow(self, data):
         # Add row to table
@@ -58,14 +97,23 @@ class SpreadsheetBuilder(DocBuilder):
                 my_data.append(d)
             else:
                 my_data.append("")
-        self.worksheet_data.append(my_data)
+        if self.high_volume:
+            self.worksheet.append(my_data)
+            self.table_rows += 1
+        else:
+            self.worksheet_data.append(my_data)
 
     def showtable(self, widths=None):
+        if self.high_volume:
+            end_column = get_column_letter(self.table_width)
+            self.worksheet.auto_filter.ref = f"A1:{end_column}{self.table_rows}"
+            self.table_width = 0
+            return
         # Add data to current worksheet
         for data in self.worksheet_data:
             self.worksheet.append(data)
         # Now make first row Bold
-        font = Font(bold=True)
+        font = self.header_font
         end_column = chr(ord("A") + self.table_width - 1)
         for row in self.worksheet[f"A1:{end_column}1"]:
             for cell in row:
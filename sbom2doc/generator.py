@@ -1,20 +1,73 @@
 # Copyright (C) 2023 Anthony Harrison
 # SPDX-License-Identifier: Apache-2.0
 
-import requests
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 from lib4sbom.data.document import SBOMDocument
-from lib4sbom.license import LicenseScanner
-from packageurl import PackageURL
 
-from sbom2doc.docbuilder.consolebuilder import ConsoleBuilder
-from sbom2doc.docbuilder.htmlbuilder import HTMLBuilder
-from sbom2doc.docbuilder.jsonbuilder import JSONBuilder
-from sbom2doc.docbuilder.markdownbuilder import MarkdownBuilder
-from sbom2doc.docbuilder.pdfbuilder import PDFBuilder
-from sbom2doc.docbuilder.spreadsheetbuilder import SpreadsheetBuilder
+from sbom2doc.aggregator import SBOMAggregator
+from sbom2doc.docbuilder.registry import create_builder, get_builder
+from sbom2doc.graph import DependencyGraph
+from sbom2doc.ingest import SBOMStream
+from sbom2doc.licensecache import LicenseCache
+from sbom2doc.profiler import Profiler
+from sbom2doc.records import purl_ecosystem
+from sbom2doc.report import Report
+from sbom2doc.vulnerabilities import VulnerabilityIndex
+
+# Sections of the document which can be selected
+SECTIONS = [
+    "summary",
+    "files",
+    "packages",
+    "components",
+    "licenses",
+    "suppliers",
+    "ntia",
+    "dependencies",
+    "services",
+    "vulnerabilities",
+]
+
+# Sections which need the full summary of each file or package. The NTIA
+# section only needs the minimum elements to be checked.
+FILE_SECTIONS = ["files", "licenses"]
+PACKAGE_SECTIONS = ["packages", "components", "licenses", "suppliers"]
+
+# Minimum number of packages formatted by each worker process
+SHARD_SIZE = 5000
 
+# Packages shared with forked worker processes
+_shard_packages = None
 
-def generate_document(format, sbom_parser, filename, outfile, include_license):
+
+def build_report(
+    sbom_parser,
+    filename,
+    include_license,
+    license_cache=None,
+    profiler=None,
+    row_workers=None,
+    sections=None,
+    spooled=False,
+):
+    # Analyse the SBOM and build the content of the document. The report
+    # can then be rendered in any format. If row_workers is specified,
+    # package rows are formatted in parallel by a pool of processes. If
+    # sections is specified, only those sections are built. If spooled is
+    # set, the rows of each table are held in temporary files so memory
+    # usage does not depend on the size of the SBOM; the report must be
+    # closed once it has been rendered.
+    if profiler is None:
+        profiler = Profiler()
+    if sections is None:
+        sections = SECTIONS
+    if isinstance(sbom_parser, SBOMStream):
+        return build_stream_report(
+            sbom_parser, filename, include_license, license_cache, profiler, sections
+        )
     # Get constituent components of the SBOM
     packages = sbom_parser.get_packages()
     files = sbom_parser.get_files()
@@ -23,242 +76,701 @@ def generate_document(format, sbom_parser, filename, outfile, include_license):
     vulnerabilities = sbom_parser.get_vulnerabilities()
     document = SBOMDocument()
     document.copy_document(sbom_parser.get_document())
-    license_info = LicenseScanner()
-
-    # Select document builder based on format
-    if format == "markdown":
-        sbom_document = MarkdownBuilder()
-    elif format == "json":
-        sbom_document = JSONBuilder()
-    elif format == "pdf":
-        sbom_document = PDFBuilder()
-    elif format == "excel":
-        sbom_document = SpreadsheetBuilder()
-    elif format == "html":
-        sbom_document = HTMLBuilder()
+    # License lookups are cached across runs
+    if license_cache is None:
+        license_info = LicenseCache()
+    else:
+        license_info = license_cache
+    summary = SBOMAggregator(license_info)
+    summary.add_document(document)
+    summary.add_relationships(relationships)
+    summary.add_services(services)
+    summary.add_vulnerabilities(vulnerabilities)
+    summarise_file, summarise_package = _summarisers(summary, sections, include_license)
+
+    report = Report(spooled=spooled)
+
+    if _selected(profiler, sections, "summary"):
+        with profiler.section("summary"), profiler.phase("summary") as phase:
+            phase["rows"] = _summary_section(
+                report, filename, document, len(files), len(packages), summary
+            )
+
+    if _selected(profiler, sections, "files"):
+        if len(files) > 0:
+            with profiler.section("files"), profiler.phase("files") as phase:
+                records = (summary.add_file(file) for file in files)
+                if spooled:
+                    _file_section(report, _spool_records(report, records))
+                else:
+                    _file_section(report, list(records), records=True)
+                phase["rows"] = len(files)
+    elif len(files) > 0 and summarise_file is not None:
+        with profiler.phase("file_summary") as phase:
+            for file in files:
+                summarise_file(file)
+            phase["rows"] = len(files)
+
+    if _selected(profiler, sections, "packages"):
+        if len(packages) > 0:
+            with profiler.section("packages"), profiler.phase("packages") as phase:
+                records = _package_records(summary, packages, row_workers)
+                if spooled:
+                    _package_section(report, _spool_records(report, records))
+                else:
+                    _package_section(report, list(records), records=True)
+                phase["rows"] = len(packages)
+    elif len(packages) > 0 and summarise_package is not None:
+        with profiler.phase("package_summary") as phase:
+            for package in packages:
+                summarise_package(package)
+            phase["rows"] = len(packages)
+    _package_summaries(report, summary, profiler, sections, len(packages))
+
+    if _selected(profiler, sections, "ntia"):
+        with profiler.section("ntia"):
+            _ntia_section(report, summary, profiler)
+
+    if _selected(profiler, sections, "dependencies") and summary.relationship_count > 0:
+        with profiler.section("dependencies"):
+            with profiler.phase("dependencies") as phase:
+                graph = DependencyGraph(packages, relationships)
+                phase["rows"] = _dependency_section(report, graph)
+
+    if _selected(profiler, sections, "services") and len(services) > 0:
+        with profiler.section("services"), profiler.phase("services") as phase:
+            _service_section(report, _table_rows(report, map(_service_row, services)))
+            phase["rows"] = len(services)
+
+    if _selected(profiler, sections, "vulnerabilities") and len(vulnerabilities) > 0:
+        with profiler.section("vulnerabilities"):
+            with profiler.phase("vulnerabilities") as phase:
+                _vulnerability_section(
+                    report,
+                    _table_rows(report, map(_vulnerability_row, vulnerabilities)),
+                )
+                phase["rows"] = len(vulnerabilities)
+            with profiler.phase("vulnerability_index"):
+                index = VulnerabilityIndex(packages, vulnerabilities)
+            _vulnerability_summaries(report, index, profiler)
+
+    if include_license:
+        _license_section(report, summary, license_info, profiler)
+    _close_caches(license_info, license_cache, profiler)
+    return report
+
+
+def build_stream_report(
+    sbom_stream,
+    filename,
+    include_license,
+    license_cache=None,
+    profiler=None,
+    sections=None,
+):
+    # Each element of the SBOM is processed as it is read. Rows of tables
+    # which depend on the size of the SBOM are held in temporary files so
+    # memory usage depends on the summary data rather than the size of the
+    # SBOM. The report must be closed once it has been rendered.
+    if profiler is None:
+        profiler = Profiler()
+    if sections is None:
+        sections = SECTIONS
+    if license_cache is None:
+        license_info = LicenseCache()
     else:
-        sbom_document = ConsoleBuilder()
-
-    sbom_document.heading(1, "SBOM Summary")
-    sbom_document.createtable(["Item", "Details"], [20, 35])
-    sbom_document.addrow(["SBOM File", filename])
-    sbom_document.addrow(["SBOM Type", document.get_type()])
-    sbom_document.addrow(["Version", document.get_version()])
-    sbom_document.addrow(["Name", document.get_name()])
-    creator_identified = False
+        license_info = license_cache
+    summary = SBOMAggregator(license_info)
+    graph = DependencyGraph()
+    index = VulnerabilityIndex()
+    document = SBOMDocument()
+    report = Report()
+    files = report.spool()
+    packages = report.spool()
+    services = report.spool()
+    vulnerabilities = report.spool()
+    # Number of each kind of element
+    counts = Counter()
+    summarise_file, summarise_package = _summarisers(summary, sections, include_license)
+    file_rows = "files" in sections
+    package_rows = "packages" in sections
+    dependencies = "dependencies" in sections
+    service_rows = "services" in sections
+    vulnerability_rows = "vulnerabilities" in sections
+
+    with profiler.phase("ingest") as phase:
+        for kind, element in sbom_stream.elements():
+            counts[kind] += 1
+            if kind == "package":
+                if package_rows:
+                    packages.append(summary.add_package(element).row())
+                elif summarise_package is not None:
+                    summarise_package(element)
+                if dependencies:
+                    graph.add_package(element)
+                if vulnerability_rows:
+                    index.add_package(element)
+            elif kind == "file":
+                if file_rows:
+                    files.append(summary.add_file(element).row())
+                elif summarise_file is not None:
+                    summarise_file(element)
+            elif kind == "relationship":
+                summary.relationship_count += 1
+                if dependencies:
+                    graph.add_relationship(element)
+            elif kind == "service":
+                if service_rows:
+                    services.append(_service_row(element))
+            elif kind == "vulnerability":
+                if vulnerability_rows:
+                    vulnerabilities.append(_vulnerability_row(element))
+                    index.add_vulnerability(element)
+            else:
+                document.copy_document(element)
+            phase["rows"] += 1
+    summary.add_document(document)
+    summary.service_count = counts["service"]
+    summary.vulnerability_count = counts["vulnerability"]
+
+    if _selected(profiler, sections, "summary"):
+        with profiler.section("summary"), profiler.phase("summary") as phase:
+            phase["rows"] = _summary_section(
+                report, filename, document, counts["file"], counts["package"], summary
+            )
+
+    if _selected(profiler, sections, "files") and counts["file"] > 0:
+        with profiler.section("files"):
+            _file_section(report, files)
+
+    if _selected(profiler, sections, "packages") and counts["package"] > 0:
+        with profiler.section("packages"):
+            _package_section(report, packages)
+    _package_summaries(report, summary, profiler, sections, counts["package"])
+
+    if _selected(profiler, sections, "ntia"):
+        with profiler.section("ntia"):
+            _ntia_section(report, summary, profiler)
+
+    if _selected(profiler, sections, "dependencies") and summary.relationship_count > 0:
+        with profiler.section("dependencies"):
+            with profiler.phase("dependencies") as phase:
+                graph.analyse()
+                phase["rows"] = _dependency_section(report, graph)
+
+    if _selected(profiler, sections, "services") and counts["service"] > 0:
+        with profiler.section("services"):
+            _service_section(report, services)
+
+    if _selected(profiler, sections, "vulnerabilities") and counts["vulnerability"] > 0:
+        with profiler.section("vulnerabilities"):
+            _vulnerability_section(report, vulnerabilities)
+            with profiler.phase("vulnerability_index"):
+                index.analyse()
+            _vulnerability_summaries(report, index, profiler)
+
+    if include_license:
+        _license_section(report, summary, license_info, profiler)
+    _close_caches(license_info, license_cache, profiler)
+    return report
+
+
+def _table_rows(report, rows):
+    # Rows are held in a temporary file if the report is spooled
+    if not report.spooled:
+        return list(rows)
+    spooled_rows = report.spool()
+    for row in rows:
+        spooled_rows.append(row)
+    return spooled_rows
+
+
+def _spool_records(report, records):
+    return _table_rows(report, (record.row() for record in records))
+
+
+def select_sections(include=None, exclude=None, choices=SECTIONS):
+    # Sections in document order
+    return [
+        section
+        for section in choices
+        if (include is None or section in include)
+        and (exclude is None or section not in exclude)
+    ]
+
+
+def _summarisers(summary, sections, include_license):
+    # Least work needed to summarise each file and package for the sections
+    # or None if files or packages are not needed
+    summarisers = []
+    for full, check, needed in [
+        (summary.add_file, summary.check_file, FILE_SECTIONS),
+        (summary.add_package, summary.check_package, PACKAGE_SECTIONS),
+    ]:
+        if include_license or any(section in needed for section in sections):
+            summarisers.append(full)
+        elif "ntia" in sections:
+            summarisers.append(check)
+        else:
+            summarisers.append(None)
+    return summarisers
+
+
+def _selected(profiler, sections, name):
+    if name in sections:
+        return True
+    profiler.skip_section(name)
+    return False
+
+
+def _summary_section(report, filename, document, files, packages, summary):
+
+    rows = 10
+    report.heading(1, "SBOM Summary")
+    report.createtable(["Item", "Details"], [20, 35])
+    report.addrow(["SBOM File", filename])
+    report.addrow(["SBOM Type", document.get_type()])
+    report.addrow(["Version", document.get_version()])
+    report.addrow(["Name", document.get_name()])
     creator = document.get_creator()
     # If creator is missing, will return None
     if creator is not None:
         for c in creator:
-            creator_identified = True
-            sbom_document.addrow(["Creator", f"{c[0]}:{c[1]}"])
-    sbom_document.addrow(["Created", document.get_created()])
-    sbom_document.addrow(["Files", str(len(files))])
-    sbom_document.addrow(["Packages", str(len(packages))])
-    sbom_document.addrow(["Relationships", str(len(relationships))])
-    sbom_document.addrow(["Services", str(len(services))])
-    sbom_document.addrow(["Vulnerabilities", str(len(vulnerabilities))])
-    sbom_document.showtable(widths=[5, 9])
-    creation_time = document.get_created() is not None
-
-    files_valid = True
-    packages_valid = True
-    relationships_valid = len(relationships) > 0
-    sbom_licenses = []
-    sbom_components = []
-    sbom_suppliers = []
-    # Create an empty dictionary
-    freq_licences = {}
-    if len(files) > 0:
-        sbom_document.heading(1, "File Summary")
-        sbom_document.createtable(["Name", "Type", "License", "Copyright"])
-        for file in files:
-            # Minimum elements are ID, Name
-            id = file.get("id", None)
-            name = file.get("name", None)
-            filetype = file.get("filetype", None)
-            if filetype is not None:
-                file_type = ", ".join(t for t in filetype)
-            else:
-                file_type = "NOT KNOWN"
-            license = file.get("licenseconcluded", "NOT KNOWN")
-            copyright = file.get("copyrighttext", "-")
-            sbom_licenses.append(license)
-            sbom_document.addrow([name, file_type, license, copyright])
-            if id is None or name is None:
-                files_valid = False
-        sbom_document.showtable(widths=[3, 2, 4, 5])
-
-    if len(packages) > 0:
-        sbom_document.heading(1, "Package Summary")
-        sbom_document.createtable(
-            [
-                "Name",
-                "Version",
-                "PURL",
-                "CPE",
-                "Type",
-                "Supplier",
-                "License",
-                "Ecosystem",
-                "Download",
-                "Copyright",
-            ],
-            [12, 8, 8, 8, 12],
-        )
-        for package in packages:
-            # Minimum elements are ID, Name, Version, Supplier
-            id = package.get("id", None)
-            name = package.get("name", None)
-            version = package.get("version", None)
-            type = package.get("type", None)
-            supplier = package.get("supplier", None)
-            license = package.get("licenseconcluded", "NOT KNOWN")
-            if license != "NOT KNOWN" and license_info.deprecated(license):
-                license = f"{license} (Deprecated)"
-            sbom_licenses.append(license)
-            sbom_components.append(type)
-            if supplier is not None:
-                sbom_suppliers.append(supplier)
-            external_info = package.get("externalreference", None)
-            ecosystem = "-"
-            purl = cpe = ""
-            if external_info is not None:
-                for reference in external_info:
-                    if reference[1] == "purl":
-                        try:
-                            purl = PackageURL.from_string(reference[2]).to_dict()
-                            ecosystem = purl["type"]
-                        except ValueError:
-                            ecosystem = "INVALID"
-                        try:
-                            purl = reference[2]
-                        except ValueError:
-                            purl = ""
-                    elif reference[1] in ["cpe22Type", "cpe23Type"]:
-                        cpe = reference[2]
-            download = package.get("downloadlocation", "NOT KNOWN")
-            copyright = package.get("copyrighttext", "-")
-            sbom_document.addrow(
-                [
-                    name,
-                    version,
-                    purl,
-                    cpe,
-                    type,
-                    supplier,
-                    license,
-                    ecosystem,
-                    download,
-                    copyright,
-                ]
-            )
-            if (
-                id is None
-                or name is None
-                or version is None
-                or supplier is None
-                or supplier == "NOASSERTION"
-            ):
-                packages_valid = False
-        sbom_document.showtable(widths=[5, 2, 2, 5])
-
-        sbom_document.heading(1, "Component Type Summary")
-        sbom_document.createtable(["Type", "Count"], [25, 6])
-        #
-        # Create an empty dictionary
-        freq = {}
-        for items in sorted(sbom_components):
-            freq[items] = sbom_components.count(items)
-        for key, value in freq.items():
-            sbom_document.addrow([key, str(value)])
-        sbom_document.showtable(widths=[10, 4])
-
-        sbom_document.heading(1, "License Summary")
-        sbom_document.createtable(["License", "Count"], [25, 6])
-        #
-        for items in sorted(sbom_licenses):
-            freq_licences[items] = sbom_licenses.count(items)
-        for key, value in freq_licences.items():
-            sbom_document.addrow([key, str(value)])
-        sbom_document.showtable(widths=[10, 4])
-
-        if len(sbom_suppliers) > 0:
-            sbom_document.heading(1, "Supplier Summary")
-            sbom_document.createtable(["Supplier", "Count"], [25, 6])
-            #
-            # Create an empty dictionary
-            freq_suppliers = {}
-            for items in sorted(sbom_suppliers):
-                freq_suppliers[items] = sbom_suppliers.count(items)
-            for key, value in freq_suppliers.items():
-                sbom_document.addrow([key, str(value)])
-            sbom_document.showtable(widths=[10, 4])
-
-    sbom_document.heading(1, "NTIA Summary")
-    sbom_document.createtable(["Element", "Status"])
-    sbom_document.addrow(["All file information provided?", str(files_valid)])
-    sbom_document.addrow(["All package information provided?", str(packages_valid)])
-    sbom_document.addrow(["Creator identified?", str(creator_identified)])
-    sbom_document.addrow(["Creation time identified?", str(creation_time)])
-    sbom_document.addrow(
-        ["Dependency relationships provided?", str(relationships_valid)]
+            report.addrow(["Creator", f"{c[0]}:{c[1]}"])
+            rows += 1
+    report.addrow(["Created", document.get_created()])
+    report.addrow(["Files", str(files)])
+    report.addrow(["Packages", str(packages)])
+    report.addrow(["Relationships", str(summary.relationship_count)])
+    report.addrow(["Services", str(summary.service_count)])
+    report.addrow(["Vulnerabilities", str(summary.vulnerability_count)])
+    report.showtable(widths=[5, 9])
+    return rows
+
+
+def _file_section(report, rows, records=False):
+    report.heading(1, "File Summary")
+    report.addtable(
+        ["Name", "Type", "License", "Copyright"],
+        rows,
+        widths=[3, 2, 4, 5],
+        records=records,
     )
-    sbom_document.showtable(widths=[10, 4])
-
-    valid_sbom = (
-        files_valid
-        and packages_valid
-        and creator_identified
-        and creation_time
-        and relationships_valid
+
+
+def _package_section(report, rows, records=False):
+    report.heading(1, "Package Summary")
+    report.addtable(
+        [
+            "Name",
+            "Version",
+            "PURL",
+            "CPE",
+            "Type",
+            "Supplier",
+            "License",
+            "Ecosystem",
+            "Download",
+            "Copyright",
+        ],
+        rows,
+        [12, 8, 8, 8, 12],
+        widths=[5, 2, 2, 5],
+        records=records,
     )
-    sbom_document.paragraph(f"NTIA conformant {valid_sbom}")
-
-    if len(services) > 0:
-        sbom_document.heading(1, "Services Summary")
-        sbom_document.createtable(["Name", "Description", "Authenticated", "Data"])
-        for service in services:
-            id = service.get("id", None)
-            name = service.get("name", "")
-            description = service.get("description", "")
-            if service.get("authenticated") is None:
-                authenticated = "Not defined"
-            else:
-                authenticated = str(service.get("authenticated"))
-            # dataitems = service.get("data", "")
-            sbom_document.addrow([name, description, authenticated, ""])
-        sbom_document.showtable(widths=[3, 2, 4, 5])
-
-    if len(vulnerabilities) > 0:
-        sbom_document.heading(1, "Vulnerabilities Summary")
-        sbom_document.createtable(["Id", "Source", "Status"])
-        for vulnerability in vulnerabilities:
-            id = vulnerability["id"]
-            status = vulnerability.get("status", "-")
-            source = vulnerability.get("source", "-")
-            sbom_document.addrow([id, source, status])
-        sbom_document.showtable(widths=[3, 2, 4, 5])
-
-    if include_license and len(freq_licences) > 0:
-        sbom_document.pagebreak()
-        sbom_document.heading(1, "License Text")
-        for key, value in freq_licences.items():
+
+
+def _package_summaries(report, summary, profiler, sections, packages):
+    # Summaries are only reported if the SBOM has packages
+    if _selected(profiler, sections, "components") and packages > 0:
+        with profiler.section("components"):
+            with profiler.phase("component_summary") as phase:
+                report.heading(1, "Component Type Summary")
+                report.createtable(["Type", "Count"], [25, 6])
+                for key, value in summary.component_summary():
+                    report.addrow([key, str(value)])
+                report.showtable(widths=[10, 4])
+                phase["rows"] = len(summary.components)
+
+    if _selected(profiler, sections, "licenses") and packages > 0:
+        with profiler.section("licenses"), profiler.phase("license_summary") as phase:
+            report.heading(1, "License Summary")
+            report.createtable(["License", "Count"], [25, 6])
+            for key, value in summary.license_summary():
+                report.addrow([key, str(value)])
+            report.showtable(widths=[10, 4])
+            phase["rows"] = len(summary.licenses)
+
+    if _selected(profiler, sections, "suppliers") and len(summary.suppliers) > 0:
+        with profiler.section("suppliers"):
+            with profiler.phase("supplier_summary") as phase:
+                report.heading(1, "Supplier Summary")
+                report.createtable(["Supplier", "Count"], [25, 6])
+                for key, value in summary.supplier_summary():
+                    report.addrow([key, str(value)])
+                report.showtable(widths=[10, 4])
+                phase["rows"] = len(summary.suppliers)
+
+
+def _ntia_section(report, summary, profiler):
+    with profiler.phase("ntia") as phase:
+        report.heading(1, "NTIA Summary")
+        report.createtable(["Element", "Status"])
+        for element, status in summary.ntia_summary():
+            report.addrow([element, str(status)])
+            phase["rows"] += 1
+        report.showtable(widths=[10, 4])
+        report.paragraph(f"NTIA conformant {summary.valid_sbom()}")
+
+
+def _service_row(service):
+    name = service.get("name", "")
+    description = service.get("description", "")
+    if service.get("authenticated") is None:
+        authenticated = "Not defined"
+    else:
+        authenticated = str(service.get("authenticated"))
+    # dataitems = service.get("data", "")
+    return [name, description, authenticated, ""]
+
+
+def _service_section(report, rows):
+    report.heading(1, "Services Summary")
+    report.addtable(
+        ["Name", "Description", "Authenticated", "Data"], rows, widths=[3, 2, 4, 5]
+    )
+
+
+def _vulnerability_row(vulnerability):
+    id = vulnerability["id"]
+    status = vulnerability.get("status", "-")
+    source = vulnerability.get("source", "-")
+    return [id, source, status]
+
+
+def _vulnerability_section(report, rows):
+    report.heading(1, "Vulnerabilities Summary")
+    report.addtable(["Id", "Source", "Status"], rows, widths=[3, 2, 4, 5])
+
+
+def _vulnerability_summaries(report, index, profiler):
+    with profiler.phase("vulnerability_summary") as phase:
+        report.heading(1, "Vulnerability Severity")
+        report.createtable(["Severity", "Count"], [25, 6])
+        for key, value in index.severity_summary():
+            report.addrow([key, str(value)])
+        report.showtable(widths=[10, 4])
+
+        report.heading(1, "Vulnerability Status")
+        report.createtable(["Status", "Count"], [25, 6])
+        for key, value in index.status_summary():
+            report.addrow([key, str(value)])
+        report.showtable(widths=[10, 4])
+        phase["rows"] = len(index.severities) + len(index.statuses)
+
+        most_affected = index.most_affected()
+        if len(most_affected) > 0:
+            report.heading(1, "Most Vulnerable Packages")
+            report.createtable(["Name", "Version", "Vulnerabilities"], [25, 12, 6])
+            for (name, version), count in most_affected:
+                report.addrow([name, version, str(count)])
+            report.showtable(widths=[10, 4, 4])
+            phase["rows"] += len(most_affected)
+        report.paragraph(
+            f"{index.count - index.unmatched} vulnerabilities affect "
+            f"{len(index.affected)} packages. {index.unmatched} vulnerabilities "
+            "do not refer to a package in the SBOM."
+        )
+
+
+def _license_section(report, summary, license_info, profiler):
+    if len(summary.licenses) == 0:
+        return
+    with profiler.phase("license_text") as phase:
+        report.pagebreak()
+        report.heading(1, "License Text")
+        for key, value in summary.license_summary():
             # Ignore undefined licenses or expressions
             if key == "NOASSERTION" or license_info.license_expression(key):
                 continue
-            # license_url = f"https://spdx.org/licenses/{key}.json"
-            try:
-                license_text = license_info.get_license_text(key)
-                if len(license_text) > 0:
-                    sbom_document.heading(2, key, number=False)
-                    sbom_document.paragraph(license_text)
-                # license_text = requests.get(license_url).json()
-                # if license_text.get("licenseText") is not None:
-                #     sbom_document.heading(2, key, number=False)
-                #     sbom_document.paragraph(license_text["licenseText"])
-            except requests.exceptions.RequestException:
-                sbom_document.heading(2, key, number=False)
-                sbom_document.paragraph("Unable to find license text.")
-
-    sbom_document.publish(outfile)
+            # License text is obtained from local license data
+            license_text = license_info.get_license_text(key)
+            if len(license_text) > 0:
+                report.heading(2, key, number=False)
+                report.paragraph(license_text)
+                phase["rows"] += 1
+
+
+def _close_caches(license_info, license_cache, profiler):
+    if license_cache is None:
+        license_info.close()
+    else:
+        license_info.flush()
+    profiler.record_cache("license", license_info.hits, license_info.misses)
+    purl_cache = purl_ecosystem.cache_info()
+    profiler.record_cache("purl", purl_cache.hits, purl_cache.misses)
+
+
+def _init_shard(packages):
+    global _shard_packages
+    _shard_packages = packages
+
+
+def _package_shard(task):
+    # Run in a worker process
+    start, end, packages, license_names = task
+    if packages is None:
+        # Inherited from the parent process
+        packages = _shard_packages[start:end]
+    summary = SBOMAggregator(None)
+    summary.license_names = license_names
+    records = [summary.add_package(package) for package in packages]
+    summary.license_names = {}
+    return records, summary
+
+
+def _package_records(summary, packages, workers=None):
+    # Records are generated in the order of the packages
+    if workers is None or len(packages) < 2 * SHARD_SIZE:
+        for package in packages:
+            yield summary.add_package(package)
+        return
+    # Licenses are resolved once so that shards do not need the license data
+    license_names = summary.prepare_licenses(packages)
+    shards = min(workers * 4, len(packages) // SHARD_SIZE)
+    size = -(-len(packages) // shards)
+    # Forked worker processes share the packages of the parent process so
+    # only the shard boundaries need to be sent
+    fork = multiprocessing.get_start_method() == "fork"
+    tasks = [
+        (
+            start,
+            start + size,
+            None if fork else packages[start : start + size],
+            license_names,
+        )
+        for start in range(0, len(packages), size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_shard if fork else None,
+        initargs=(packages,) if fork else (),
+    ) as executor:
+        # Shards are returned in order so records are identical to serial
+        # processing
+        for shard_records, shard_summary in executor.map(_package_shard, tasks):
+            summary.merge(shard_summary)
+            yield from shard_records
+
+
+def _dependency_section(report, graph):
+    rows = 9
+    report.heading(1, "Dependency Summary")
+    report.createtable(["Item", "Details"], [20, 35])
+    report.addrow(["Packages", str(len(graph.names))])
+    report.addrow(["Dependency relationships", str(graph.edge_count)])
+    report.addrow(["Root packages", str(len(graph.roots))])
+    report.addrow(["Orphan packages", str(len(graph.orphans))])
+    report.addrow(["Direct dependencies", str(graph.direct_dependencies())])
+    report.addrow(["Transitive dependencies", str(graph.transitive_dependencies())])
+    report.addrow(["Maximum depth", str(graph.max_depth())])
+    report.addrow(["Cycles", str(len(graph.cycles))])
+    report.addrow(["Packages in cycles", str(sum(len(c) for c in graph.cycles))])
+    report.showtable(widths=[5, 9])
+
+    depths = graph.depth_summary()
+    if len(depths) > 0:
+        report.heading(1, "Dependency Depth")
+        report.createtable(["Depth", "Packages"], [6, 6])
+        for depth, count in depths:
+            report.addrow([str(depth), str(count)])
+        report.showtable(widths=[4, 4])
+        rows += len(depths)
+
+    if len(graph.roots) > 0:
+        report.heading(1, "Root Packages")
+        report.createtable(["Name", "Dependencies"], [25, 6])
+        for node in graph.roots:
+            report.addrow([graph.name(node), str(len(graph.edges[node]))])
+        report.showtable(widths=[10, 4])
+        rows += len(graph.roots)
+
+    most_dependents = graph.most_dependents()
+    if len(most_dependents) > 0:
+        report.heading(1, "Most Used Packages")
+        report.createtable(["Name", "Dependents"], [25, 6])
+        for name, count in most_dependents:
+            report.addrow([name, str(count)])
+        report.showtable(widths=[10, 4])
+        rows += len(most_dependents)
+
+    if len(graph.orphans) > 0:
+        report.heading(1, "Orphan Packages")
+        report.createtable(["Name"], [25])
+        for node in graph.orphans:
+            report.addrow([graph.name(node)])
+        report.showtable(widths=[10])
+        rows += len(graph.orphans)
+
+    if len(graph.cycles) > 0:
+        report.heading(1, "Dependency Cycles")
+        report.createtable(["Cycle", "Size", "Packages"], [6, 6])
+        for number, cycle in enumerate(graph.cycles, start=1):
+            packages = ", ".join(graph.name(node) for node in cycle)
+            report.addrow([str(number), str(len(cycle)), packages])
+        report.showtable(widths=[2, 2, 10])
+        rows += len(graph.cycles)
+    return rows
+
+
+def render_document(
+    report, format, outfile, stream=False, high_volume=False, profiler=None
+):
+    if profiler is None:
+        profiler = Profiler()
+    # Select document builder based on format. Only the selected
+    # builder is imported.
+    with profiler.phase("builder") as phase:
+        phase["format"] = format
+        sbom_document = create_builder(format)
+    if high_volume:
+        sbom_document.set_high_volume()
+
+    if stream and sbom_document.streaming:
+        # Write content to output as it is produced
+        sbom_document.open_stream(outfile)
+
+    with profiler.phase("render") as phase:
+        phase["format"] = format
+        report.render(sbom_document)
+        phase["rows"] = report.rows()
+
+    with profiler.phase("publish") as phase:
+        phase["format"] = format
+        sbom_document.publish(outfile)
+
+
+def _render_document(task):
+    # Run in a worker process
+    report, format, outfile, options = task
+    render_document(report, format, outfile, **options)
+    return outfile
+
+
+def generate_document(
+    format,
+    sbom_parser,
+    filename,
+    outfile,
+    include_license,
+    stream=False,
+    license_cache=None,
+    high_volume=False,
+    profiler=None,
+    row_workers=None,
+    sections=None,
+):
+    generate_documents(
+        [(format, outfile)],
+        sbom_parser,
+        filename,
+        include_license,
+        stream=stream,
+        license_cache=license_cache,
+        high_volume=high_volume,
+        profiler=profiler,
+        row_workers=row_workers,
+        sections=sections,
+    )
+
+
+def generate_documents(
+    documents,
+    sbom_parser,
+    filename,
+    include_license,
+    stream=False,
+    license_cache=None,
+    high_volume=False,
+    profiler=None,
+    parallel=None,
+    workers=None,
+    row_workers=None,
+    sections=None,
+):
+    # Documents is a list of (format, outfile). The SBOM is only analysed
+    # once. Documents are rendered in turn or, if parallel is "thread" or
+    # "process", concurrently by a pool of workers.
+    if profiler is None:
+        profiler = Profiler()
+    # Memory usage is only bounded if every document is written as it is
+    # rendered, so only then are the rows of the report held in temporary
+    # files
+    spooled = stream and all(get_builder(format).streaming for format, _ in documents)
+    report = build_report(
+        sbom_parser,
+        filename,
+        include_license,
+        license_cache=license_cache,
+        profiler=profiler,
+        row_workers=row_workers,
+        sections=sections,
+        spooled=spooled,
+    )
+    try:
+        render_documents(
+            report,
+            documents,
+            stream=stream,
+            high_volume=high_volume,
+            profiler=profiler,
+            parallel=parallel,
+            workers=workers,
+        )
+    finally:
+        report.close()
+
+
+def render_documents(
+    report,
+    documents,
+    stream=False,
+    high_volume=False,
+    profiler=None,
+    parallel=None,
+    workers=None,
+):
+    if profiler is None:
+        profiler = Profiler()
+    options = {"stream": stream, "high_volume": high_volume}
+    # Console output is always rendered by the caller
+    pending = []
+    for format, outfile in documents:
+        if parallel is None or format == "console" or len(documents) == 1:
+            render_document(report, format, outfile, profiler=profiler, **options)
+        else:
+            pending.append((format, outfile))
+    if len(pending) == 0:
+        return
+    if parallel == "process":
+        tasks = [(report, format, outfile, options) for format, outfile in pending]
+        with profiler.phase("render") as phase:
+            phase["format"] = ",".join(format for format, _ in pending)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_render_document, tasks))
+            phase["rows"] = report.rows() * len(pending)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    render_document,
+                    report,
+                    format,
+                    outfile,
+                    profiler=profiler,
+                    **options,
+                )
+                for format, outfile in pending
+            ]
+            for future in futures:
+                future.result()
@@ -0,0 +1,182 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import heapq
+from collections import Counter, deque
+
+# Relationships from a package to one of its dependencies
+DEPENDENCY_TYPES = ["DEPENDS_ON", "CONTAINS"]
+# Relationships from a dependency to the dependent package
+REVERSE_DEPENDENCY_TYPES = ["DEPENDENCY_OF", "CONTAINED_BY"]
+
+
+class DependencyGraph:
+    # Adjacency index of the dependency relationships between packages.
+    # Packages are numbered and edges are held as lists of node numbers so
+    # that all of the analysis is linear in the number of nodes and edges.
+
+    def __init__(self, packages=(), relationships=()):
+        self.ids = {}
+        self.names = []
+        self.edges = []
+        self.dependents = []
+        self.described = set()
+        self.edge_count = 0
+        # Package identifiers used in relationships
+        self.labels = {}
+        for package in packages:
+            self.add_package(package)
+        for relationship in relationships:
+            self.add_relationship(relationship)
+        self.analyse()
+
+    def add_package(self, package):
+        name = package.get("name", "")
+        for key in ("id", "bom-ref"):
+            if package.get(key) is not None:
+                self.labels[package[key]] = name
+        id = package.get("bom-ref", package.get("id"))
+        if id is not None:
+            node = self._node(id)
+            self.names[node] = self.labels[id] or str(id)
+
+    def add_relationship(self, relationship):
+        # Packages must be added before relationships
+        type = relationship.get("type")
+        source = relationship.get("source_id")
+        target = relationship.get("target_id")
+        self.labels.setdefault(source, relationship.get("source"))
+        self.labels.setdefault(target, relationship.get("target"))
+        if type == "DESCRIBES":
+            self.described.add(self._node(target))
+        elif type in DEPENDENCY_TYPES:
+            self._edge(source, target)
+        elif type in REVERSE_DEPENDENCY_TYPES:
+            self._edge(target, source)
+
+    def _node(self, id):
+        node = self.ids.get(id)
+        if node is None:
+            node = len(self.names)
+            self.ids[id] = node
+            self.names.append(self.labels.get(id) or str(id))
+            self.edges.append([])
+            self.dependents.append(0)
+        return node
+
+    def _edge(self, source, target):
+        source_node = self._node(source)
+        target_node = self._node(target)
+        self.edges[source_node].append(target_node)
+        self.dependents[target_node] += 1
+        self.edge_count += 1
+
+    def analyse(self):
+        # Called once all packages and relationships have been added
+        nodes = len(self.names)
+        # Packages described by the SBOM and packages which are not a
+        # dependency of another package
+        self.roots = [
+            node
+            for node in range(nodes)
+            if node in self.described
+            or (self.dependents[node] == 0 and len(self.edges[node]) > 0)
+        ]
+        self.orphans = [
+            node
+            for node in range(nodes)
+            if self.dependents[node] == 0
+            and len(self.edges[node]) == 0
+            and node not in self.described
+        ]
+        # Breadth first search from all roots gives the minimum depth of
+        # each reachable package. Roots are at depth 0.
+        self.depth = [None] * nodes
+        queue = deque(self.roots)
+        for node in self.roots:
+            self.depth[node] = 0
+        while queue:
+            node = queue.popleft()
+            for dependency in self.edges[node]:
+                if self.depth[dependency] is None:
+                    self.depth[dependency] = self.depth[node] + 1
+                    queue.append(dependency)
+        self.cycles = self._cycles()
+
+    def _cycles(self):
+        # Tarjan's strongly connected components algorithm without recursion
+        # so that long dependency chains do not exceed the recursion limit
+        nodes = len(self.names)
+        index = [None] * nodes
+        lowlink = [0] * nodes
+        on_stack = [False] * nodes
+        stack = []
+        cycles = []
+        counter = 0
+        for start in range(nodes):
+            if index[start] is not None:
+                continue
+            work = [(start, 0)]
+            while work:
+                node, position = work[-1]
+                if position == 0:
+                    index[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                edges = self.edges[node]
+                while position < len(edges):
+                    dependency = edges[position]
+                    position += 1
+                    if index[dependency] is None:
+                        break
+                    if on_stack[dependency]:
+                        lowlink[node] = min(lowlink[node], index[dependency])
+                else:
+                    dependency = None
+                if dependency is not None and index[dependency] is None:
+                    # Visit dependency then resume this node
+                    work[-1] = (node, position)
+                    work.append((dependency, 0))
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self.edges[node]:
+                        cycles.append(sorted(component))
+        return sorted(cycles, key=lambda cycle: (-len(cycle), cycle))
+
+    def direct_dependencies(self):
+        # Packages which are dependencies of a root package
+        return sum(1 for depth in self.depth if depth == 1)
+
+    def transitive_dependencies(self):
+        # Packages which are only indirect dependencies of a root package
+        return sum(1 for depth in self.depth if depth is not None and depth > 1)
+
+    def max_depth(self):
+        return max((depth for depth in self.depth if depth is not None), default=0)
+
+    def depth_summary(self):
+        return sorted(Counter(d for d in self.depth if d is not None).items())
+
+    def most_dependents(self, count=10):
+        # Packages which are the dependency of the most other packages
+        nodes = heapq.nsmallest(
+            count,
+            (node for node in range(len(self.names)) if self.dependents[node] > 0),
+            key=lambda node: (-self.dependents[node], self.names[node]),
+        )
+        return [(self.names[node], self.dependents[node]) for node in nodes]
+
+    def name(self, node):
+        return self.names[node]
@@ -0,0 +1,466 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import bz2
+import gzip
+import io
+import json
+import lzma
+import mmap
+import sys
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+
+from lib4sbom.cyclonedx.cyclonedx_parser import CycloneDXParser
+from lib4sbom.data.relationship import SBOMRelationship
+from lib4sbom.exception import SBOMParserException
+from lib4sbom.parser import SBOMParser
+from lib4sbom.sbom import ParserType
+from lib4sbom.spdx.spdx_parser import SPDXParser
+
+try:
+    import zstandard
+except ImportError:
+    # Optional support for zstandard compressed SBOMs
+    zstandard = None
+
+# Name of the input file for the standard input
+STDIN = "-"
+
+# Size of each read from the SBOM file
+CHUNK_SIZE = 1024 * 1024
+
+# Number of elements converted by each call to the parser
+BATCH_SIZE = 1000
+
+# Tags which start a new element in a SPDX tag value document
+SPDX_ELEMENTS = ("PackageName", "FileName", "LicenseID", "SnippetSPDXID")
+
+# CycloneDX elements which are processed as they are read
+CYCLONEDX_ELEMENTS = ["components", "dependencies", "vulnerabilities", "services"]
+
+# Parser for each SBOM filename extension in order of precedence
+PARSER_TYPES = [
+    ((".bom.json", ".cdx.json"), ParserType.CYCLONEDX_JSON),
+    ((".bom.xml", ".cdx.xml", ".xml"), ParserType.CYCLONEDX_XML),
+    ((".spdx",), ParserType.SPDX_TAG),
+    ((".jsonld",), ParserType.SPDX_JSONLD),
+    ((".spdx.json",), ParserType.SPDX_JSON),
+    ((".spdx.yaml", "spdx.yml"), ParserType.SPDX_YML),
+    ((".spdx.rdf",), ParserType.SPDX_RDF),
+    ((".spdx.xml",), ParserType.SPDX_XML),
+    ((".json",), ParserType.JSON),
+]
+
+_decoder = json.JSONDecoder()
+
+
+def _zstandard_open(filename):
+    if zstandard is None:
+        raise SBOMParserException("zstandard is required to read .zst files")
+    return zstandard.ZstdDecompressor().stream_reader(open(filename, "rb"))
+
+
+# Decompressor for each compressed file extension
+COMPRESSION = {
+    ".gz": gzip.open,
+    ".xz": lzma.open,
+    ".bz2": bz2.open,
+    ".zst": _zstandard_open,
+}
+
+# Errors raised if a SBOM cannot be read, including truncated or corrupt
+# compressed SBOMs
+INPUT_ERRORS = (
+    SBOMParserException,
+    OSError,
+    EOFError,
+    lzma.LZMAError,
+    zlib.error,
+)
+if zstandard is not None:
+    INPUT_ERRORS += (zstandard.ZstdError,)
+
+
+class SBOMInputError(SBOMParserException):
+    # Error reading a SBOM. The message includes the name of the SBOM.
+    pass
+
+
+def _describe(e):
+    if len(str(e)) > 0:
+        return f"{type(e).__name__}: {e}"
+    return type(e).__name__
+
+
+@contextmanager
+def reading(filename):
+    # Errors reading the SBOM are raised as SBOMInputError so that they are
+    # not confused with errors writing the documents
+    try:
+        yield
+    except SBOMInputError:
+        raise
+    except FileNotFoundError as e:
+        raise SBOMInputError(f"{filename} not found") from e
+    except INPUT_ERRORS as e:
+        raise SBOMInputError(f"{filename}: {_describe(e)}") from e
+
+
+def sbom_name(filename):
+    # Name of the SBOM without any compression extension
+    for extension in COMPRESSION:
+        if filename.endswith(extension):
+            return filename[: -len(extension)]
+    return filename
+
+
+def open_sbom(filename):
+    # Text stream of the SBOM. Compressed SBOMs are decompressed as they
+    # are read.
+    if filename == STDIN:
+        return io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    opener = COMPRESSION.get(filename[len(sbom_name(filename)) :])
+    if opener is None:
+        return open(filename, "r", encoding="utf-8")
+    return io.TextIOWrapper(opener(filename), encoding="utf-8")
+
+
+def read_sbom(filename):
+    # Contents of the SBOM. Uncompressed files are decoded from a memory
+    # map of the file rather than copied to a buffer first.
+    if filename != STDIN and sbom_name(filename) == filename:
+        with open(filename, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return str(data, "utf-8")
+    with open_sbom(filename) as f:
+        return f.read()
+
+
+def stream_type(filename):
+    # Type of SBOM if the file can be read incrementally, otherwise None
+    if filename == STDIN:
+        return None
+    name = sbom_name(filename)
+    if name.endswith(".spdx"):
+        return "spdx"
+    if name.endswith((".bom.json", ".cdx.json")):
+        return "cyclonedx"
+    if name.endswith(".json") and not name.endswith(".spdx.json"):
+        with open_sbom(filename) as f:
+            if '"bomFormat"' in f.read(CHUNK_SIZE):
+                return "cyclonedx"
+    return None
+
+
+class _CycloneDXParser(CycloneDXParser):
+    # CycloneDXParser which also reports the severity of each vulnerability.
+    # The severity is taken from the first rating which has a severity.
+
+    def parse_cyclonedx_json(self, data):
+        result = super().parse_cyclonedx_json(data)
+        # Vulnerabilities are converted in the order of the document
+        for vulnerability, element in zip(result[4], data.get("vulnerabilities", [])):
+            for rating in element.get("ratings", []):
+                if rating.get("severity") is not None:
+                    vulnerability["severity"] = rating["severity"]
+                    break
+        return result
+
+
+class SBOMInputParser(SBOMParser):
+    # SBOMParser which also reads compressed SBOMs and the standard input.
+    # The type of a compressed SBOM is determined from the filename without
+    # the compression extension and the type of the standard input (or of a
+    # string) is determined from its contents.
+
+    @property
+    def parser(self):
+        return self._parser
+
+    @parser.setter
+    def parser(self, parser):
+        # Parser is created for each SBOM by SBOMParser
+        if type(parser) is CycloneDXParser:
+            parser = _CycloneDXParser()
+        self._parser = parser
+
+    def parse_file(self, filename):
+        if filename == STDIN:
+            self.parse_string(read_sbom(filename))
+            return
+        path = Path(filename)
+        if not (path.is_file() and path.stat().st_size > 0):
+            raise FileNotFoundError
+        name = sbom_name(filename)
+        for extensions, parser_type in PARSER_TYPES:
+            if name.endswith(extensions):
+                self._parse_sbom(read_sbom(filename), parser_type)
+                return
+        raise SBOMParserException
+
+    def parse_string(self, sbom_string):
+        super().parse_string(sbom_string)
+        # Content which is not a SBOM is parsed without error as an empty
+        # SBOM of unknown type
+        if (
+            self.get_document().get("type") is None
+            and len(self.get_packages()) == 0
+            and len(self.get_files()) == 0
+        ):
+            raise SBOMParserException("Unable to determine the type of SBOM")
+
+
+class _JSONReader:
+    # Decodes the values of a JSON document from a buffer which is filled
+    # from the file as required so that only part of the document is held
+    # in memory.
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.data = ""
+        self.position = 0
+        self.eof = False
+
+    def _fill(self, size=None):
+        chunk = self.file.read(max(size or 0, self.chunk_size))
+        if chunk == "":
+            self.eof = True
+            return False
+        self.data = self.data[self.position :] + chunk
+        self.position = 0
+        return True
+
+    def peek(self):
+        # Next character which is not whitespace
+        while True:
+            while self.position < len(self.data):
+                if not self.data[self.position].isspace():
+                    return self.data[self.position]
+                self.position += 1
+            if not self._fill():
+                raise SBOMParserException
+
+    def expect(self, character):
+        if self.peek() != character:
+            raise SBOMParserException
+        self.position += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.data, self.position)
+                # A number may continue in the next chunk
+                if end < len(self.data) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise SBOMParserException
+            # Value is incomplete. The buffer is doubled so that large
+            # values are not decoded many times.
+            self._fill(len(self.data) - self.position)
+
+    def members(self):
+        # Name of each member of an object. The value must be read by the
+        # caller before the next name is returned.
+        self.expect("{")
+        if self.peek() == "}":
+            self.position += 1
+            return
+        while True:
+            name = self.value()
+            self.expect(":")
+            yield name
+            if self.peek() == "}":
+                self.position += 1
+                return
+            self.expect(",")
+
+    def items(self):
+        # Each value of an array
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == "]":
+                self.position += 1
+                return
+            self.expect(",")
+
+
+def _batches(values, size):
+    batch = []
+    for value in values:
+        batch.append(value)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if len(batch) > 0:
+        yield batch
+
+
+class SBOMStream:
+    # Reads the elements of a SPDX tag value or CycloneDX JSON SBOM as they
+    # are found in the file rather than parsing the whole SBOM into memory.
+    # Each element is converted by the lib4sbom parser so elements are the
+    # same as those returned by SBOMParser. Relationships are returned once
+    # all elements have been read as they can refer to elements later in
+    # the file. Duplicate packages are returned as they are found. The SBOM
+    # may be compressed but can not be the standard input as it is read
+    # again for each iteration.
+
+    def __init__(self, chunk_size=CHUNK_SIZE):
+        self.filename = None
+        self.sbom_type = None
+        self.chunk_size = chunk_size
+
+    def parse_file(self, filename):
+        # Elements are only read when the stream is iterated
+        path = Path(filename)
+        if not (path.is_file() and path.stat().st_size > 0):
+            raise FileNotFoundError
+        self.sbom_type = stream_type(filename)
+        if self.sbom_type is None:
+            raise SBOMParserException
+        self.filename = filename
+
+    def elements(self):
+        # Yields (kind, element) where kind is document, file, package,
+        # relationship, service or vulnerability. Errors reading the SBOM
+        # are raised as SBOMInputError.
+        if self.sbom_type == "spdx":
+            return self._checked(self._spdx_elements())
+        return self._checked(self._cyclonedx_elements())
+
+    def _checked(self, elements):
+        with reading(self.filename):
+            yield from elements
+
+    def get_packages(self):
+        return (element for kind, element in self.elements() if kind == "package")
+
+    def get_files(self):
+        return (element for kind, element in self.elements() if kind == "file")
+
+    def _spdx_batches(self, file, relationships):
+        # Lines of the document header and of each batch of elements.
+        # Relationships are added to the list of relationships.
+        batch = []
+        elements = 0
+        ignore = False
+        for line in file:
+            tag = line.split(":", 1)[0]
+            if tag == "Relationship":
+                # Format is TAG SOURCE TYPE TARGET
+                relationship = line.split(":", 1)[1].split()
+                if len(relationship) >= 3:
+                    relationships.append(relationship[:3])
+                continue
+            if tag in SPDX_ELEMENTS:
+                # Licenses and snippets are not reported
+                ignore = tag in ("LicenseID", "SnippetSPDXID")
+                if not ignore:
+                    if elements == BATCH_SIZE:
+                        yield batch
+                        batch = []
+                        elements = 0
+                    elements += 1
+            if not ignore:
+                batch.append(line)
+        yield batch
+
+    def _spdx_elements(self):
+        parser = SPDXParser()
+        names = {}
+        relationships = []
+        document = None
+        with open_sbom(self.filename) as f:
+            for batch in self._spdx_batches(f, relationships):
+                document_data, files, packages, _, _, _, _ = parser.parse_spdx_tag(
+                    batch
+                )
+                if document is None:
+                    # Header is in the first batch
+                    document = document_data.get_document()
+                    names[document.get("id")] = document.get("name")
+                for file in files.values():
+                    names[file.get("id")] = file.get("name")
+                    yield "file", file
+                for package in packages.values():
+                    names[package.get("id")] = package.get("name")
+                    yield "package", package
+        yield "document", document or {}
+        # Only relationships between elements in the SBOM are reported
+        spdx_relationship = SBOMRelationship()
+        for source, type, target in relationships:
+            if source in names and target in names:
+                spdx_relationship.initialise()
+                spdx_relationship.set_relationship(names[source], type, names[target])
+                spdx_relationship.set_relationship_id(source, target)
+                yield "relationship", spdx_relationship.get_relationship()
+
+    def _cyclonedx_document(self, parser, header, key, values):
+        # Converts part of the document using the parser
+        parser.packages = {}
+        parser.id = {}
+        data = dict(header)
+        data[key] = values
+        return parser.parse_cyclonedx_json(data)
+
+    def _cyclonedx_elements(self):
+        parser = _CycloneDXParser()
+        header = {"bomFormat": "CycloneDX", "specVersion": "1.4"}
+        names = {}
+        dependencies = []
+        with open_sbom(self.filename) as f:
+            reader = _JSONReader(f, self.chunk_size)
+            for name in reader.members():
+                if name not in CYCLONEDX_ELEMENTS:
+                    header[name] = reader.value()
+                    if name == "bomFormat" and header[name] != "CycloneDX":
+                        raise SBOMParserException
+                elif name == "dependencies":
+                    for dependency in reader.items():
+                        dependencies.append(
+                            (dependency["ref"], dependency.get("dependsOn"))
+                        )
+                else:
+                    for batch in _batches(reader.items(), BATCH_SIZE):
+                        result = self._cyclonedx_document(parser, header, name, batch)
+                        if name == "components":
+                            for package in result[2].values():
+                                names[package.get("bom-ref")] = package.get("name")
+                                yield "package", package
+                        elif name == "vulnerabilities":
+                            for vulnerability in result[4]:
+                                yield "vulnerability", vulnerability
+                        else:
+                            for service in result[5]:
+                                yield "service", service
+        # Document metadata can be anywhere in the file
+        document = self._cyclonedx_document(parser, header, "components", [])[0]
+        # Components take precedence over the metadata component
+        for bom_ref, name in parser.id.items():
+            names.setdefault(bom_ref, name)
+        yield "document", document.get_document()
+        # First dependency is assumed to be the root element
+        type = "DESCRIBES"
+        cyclonedx_relationship = SBOMRelationship()
+        for source_id, depends_on in dependencies:
+            source = names.get(source_id)
+            if source is not None and depends_on is not None:
+                for target_id in depends_on:
+                    if target_id in names:
+                        cyclonedx_relationship.initialise()
+                        cyclonedx_relationship.set_relationship(
+                            source, type, names[target_id]
+                        )
+                        cyclonedx_relationship.set_relationship_id(source_id, target_id)
+                        yield "relationship", cyclonedx_relationship.get_relationship()
+            type = "DEPENDS_ON"
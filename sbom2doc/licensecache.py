@@ -0,0 +1,197 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from lib4sbom.license import LicenseScanner
+from lib4sbom.version import VERSION as LIB4SBOM_VERSION
+
+CACHE_FILE = "license-cache.sqlite"
+
+# Increment if the format of the cached data changes
+SCHEMA_VERSION = 1
+
+# Maximum size of cached values in bytes
+DEFAULT_MAX_SIZE = 32 * 1024 * 1024
+
+
+def default_cache_dir():
+    cache_dir = os.getenv("SBOM2DOC_CACHE_DIR")
+    if cache_dir is None:
+        cache_home = os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+        cache_dir = os.path.join(cache_home, "sbom2doc")
+    return cache_dir
+
+
+class LicenseCache:
+    # Results of license lookups are held in memory for the current run and
+    # stored in a SQLite database which can be shared by multiple processes.
+    # All license data comes from the license files distributed with lib4sbom
+    # so no network access is required. The cache is invalidated if the
+    # version of lib4sbom changes. A cache can be shared by multiple threads.
+
+    def __init__(self, cache_dir=None, max_size=DEFAULT_MAX_SIZE, enabled=True):
+        self.memory = {}
+        self.updates = {}
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+        self.max_size = max_size
+        self.version = (
+            f"{SCHEMA_VERSION}:{LIB4SBOM_VERSION}:"
+            f"{getattr(LicenseScanner, 'SPDX_LICENSE_VERSION', '')}"
+        )
+        self._scanner = None
+        self.connection = None
+        self.lock = threading.RLock()
+        if enabled:
+            self._open(cache_dir or default_cache_dir())
+
+    def _open(self, cache_dir):
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            self.connection = sqlite3.connect(
+                os.path.join(cache_dir, CACHE_FILE),
+                timeout=30,
+                check_same_thread=False,
+            )
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS license "
+                "(kind TEXT, license TEXT, value TEXT, last_used REAL, "
+                "PRIMARY KEY (kind, license))"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS metadata "
+                "(key TEXT PRIMARY KEY, value TEXT)"
+            )
+            row = self.connection.execute(
+                "SELECT value FROM metadata WHERE key = 'version'"
+            ).fetchone()
+            if row is None or row[0] != self.version:
+                # Cached data is from a different version of the license data
+                with self.connection:
+                    self.connection.execute("DELETE FROM license")
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO metadata VALUES ('version', ?)",
+                        (self.version,),
+                    )
+            self.connection.commit()
+        except (OSError, sqlite3.Error):
+            # Continue with an in-memory cache
+            self.connection = None
+
+    def _license_scanner(self):
+        # Only load the license data if a lookup is not cached
+        if self._scanner is None:
+            self._scanner = LicenseScanner()
+        return self._scanner
+
+    def _lookup(self, kind, license):
+        with self.lock:
+            return self._cached_lookup(kind, license)
+
+    def _cached_lookup(self, kind, license):
+        key = (kind, license)
+        if key in self.memory:
+            self.hits += 1
+            if self.connection is not None and key not in self.updates:
+                self.used.add(key)
+            return self.memory[key]
+        if self.connection is not None:
+            try:
+                row = self.connection.execute(
+                    "SELECT value FROM license WHERE kind = ? AND license = ?", key
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                self.hits += 1
+                value = json.loads(row[0])
+                self.memory[key] = value
+                self.used.add(key)
+                return value
+        self.misses += 1
+        scanner = self._license_scanner()
+        if kind == "deprecated":
+            value = scanner.deprecated(license)
+        elif kind == "expression":
+            value = scanner.license_expression(license)
+        else:
+            value = scanner.get_license_text(license)
+        self.memory[key] = value
+        self.updates[key] = value
+        return value
+
+    def deprecated(self, license):
+        return self._lookup("deprecated", license)
+
+    def license_expression(self, license):
+        return self._lookup("expression", license)
+
+    def get_license_text(self, license):
+        return self._lookup("text", license)
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
+
+    def _evict(self):
+        # Remove least recently used entries until within size limit
+        total = self.connection.execute(
+            "SELECT COALESCE(SUM(LENGTH(value)), 0) FROM license"
+        ).fetchone()[0]
+        if total <= self.max_size:
+            return
+        rows = self.connection.execute(
+            "SELECT kind, license, LENGTH(value) FROM license ORDER BY last_used"
+        ).fetchall()
+        expired = []
+        for kind, license, size in rows:
+            if total <= self.max_size:
+                break
+            expired.append((kind, license))
+            total -= size
+        self.connection.executemany(
+            "DELETE FROM license WHERE kind = ? AND license = ?", expired
+        )
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        # Changes are written in a single transaction
+        if self.connection is None:
+            return
+        now = time.time()
+        try:
+            with self.connection:
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO license VALUES (?, ?, ?, ?)",
+                    [
+                        (kind, license, json.dumps(value), now)
+                        for (kind, license), value in self.updates.items()
+                    ],
+                )
+                self.connection.executemany(
+                    "UPDATE license SET last_used = ? WHERE kind = ? AND license = ?",
+                    [(now, kind, license) for kind, license in self.used],
+                )
+                self._evict()
+        except sqlite3.Error:
+            # Cache is only an optimisation
+            pass
+        self.updates = {}
+        self.used = set()
+
+    def close(self):
+        with self.lock:
+            self._flush()
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
@@ -0,0 +1,254 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import heapq
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from lib4sbom.data.document import SBOMDocument
+
+from sbom2doc.aggregator import SBOMAggregator
+from sbom2doc.ingest import SBOMInputParser
+from sbom2doc.licensecache import LicenseCache
+from sbom2doc.report import Report
+
+# Sections of the portfolio document which can be selected
+SECTIONS = ["summary", "packages", "components", "licenses", "suppliers", "ntia"]
+
+
+def portfolio_key(record):
+    # Identity of a package version. The PURL (without qualifiers and
+    # subpath) is used if available.
+    if record.purl:
+        return record.purl.split("#")[0].split("?")[0]
+    return f"{record.name}@{record.version}"
+
+
+class Portfolio:
+    # Summary of a set of SBOMs. Packages are deduplicated across the SBOMs
+    # and the component type, license and supplier counts are of the
+    # distinct packages. Each SBOM is summarised separately and the
+    # summaries merged so that SBOMs can be processed in parallel.
+
+    def __init__(self):
+        # Rows of the SBOM table
+        self.sboms = []
+        # (input, error) of each SBOM which could not be processed
+        self.failed = []
+        self.packages = {}
+        # Number of SBOMs containing each package
+        self.usage = Counter()
+        self.summary = SBOMAggregator(None)
+        # Number of SBOMs providing each NTIA element
+        self.ntia = Counter()
+        self.conformant = 0
+        self.package_count = 0
+        self.file_count = 0
+        self.relationship_count = 0
+
+    def add_sbom(self, sbom_parser, filename, license_info):
+        document = SBOMDocument()
+        document.copy_document(sbom_parser.get_document())
+        summary = SBOMAggregator(license_info)
+        summary.add_document(document)
+        summary.add_relationships(sbom_parser.get_relationships())
+        for file in sbom_parser.get_files():
+            summary.check_file(file)
+        keys = set()
+        for package in sbom_parser.get_packages():
+            record = summary.add_package(package)
+            key = portfolio_key(record)
+            if key not in keys:
+                keys.add(key)
+                self._add_package(key, record)
+        self.usage.update(keys)
+        for element, status in summary.ntia_summary():
+            self.ntia[element] += int(status)
+        self.conformant += int(summary.valid_sbom())
+        self.package_count += summary.package_count
+        self.file_count += summary.file_count
+        self.relationship_count += summary.relationship_count
+        self.sboms.append(
+            [
+                filename,
+                document.get_name(),
+                document.get_type(),
+                str(summary.package_count),
+                str(summary.file_count),
+                str(summary.relationship_count),
+                str(summary.valid_sbom()),
+            ]
+        )
+
+    def _add_package(self, key, record):
+        if key not in self.packages:
+            self.packages[key] = record
+            self.summary.add_record(record)
+
+    def merge(self, other):
+        self.sboms.extend(other.sboms)
+        self.failed.extend(other.failed)
+        for key, record in other.packages.items():
+            self._add_package(key, record)
+        self.usage.update(other.usage)
+        self.ntia.update(other.ntia)
+        self.conformant += other.conformant
+        self.package_count += other.package_count
+        self.file_count += other.file_count
+        self.relationship_count += other.relationship_count
+
+    def most_used(self, count=10):
+        # Packages included in the most SBOMs
+        return heapq.nsmallest(
+            count, self.usage.items(), key=lambda item: (-item[1], item[0])
+        )
+
+
+def summarise_sbom(input_file, cache_dir="", use_cache=True):
+    # Run in a worker process. Errors are recorded rather than raised so
+    # that a single invalid SBOM does not stop the processing of the
+    # remaining SBOMs.
+    portfolio = Portfolio()
+    license_cache = LicenseCache(cache_dir=cache_dir, enabled=use_cache)
+    try:
+        sbom_parser = SBOMInputParser()
+        sbom_parser.parse_file(input_file)
+        portfolio.add_sbom(sbom_parser, input_file, license_cache)
+    except FileNotFoundError:
+        portfolio.failed.append((input_file, f"{input_file} not found"))
+    except Exception as e:
+        error = type(e).__name__
+        if len(str(e)) > 0:
+            error = f"{type(e).__name__}: {e}"
+        portfolio.failed.append((input_file, error))
+    license_cache.close()
+    return portfolio
+
+
+def _summarise_sbom(task):
+    return summarise_sbom(*task)
+
+
+def run_portfolio(inputs, workers=None, cache_dir="", use_cache=True):
+    # SBOMs are parsed in parallel by a pool of processes and the summaries
+    # merged in the order of the inputs
+    tasks = [(input_file, cache_dir, use_cache) for input_file in inputs]
+    portfolio = Portfolio()
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            portfolio.merge(_summarise_sbom(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for summary in executor.map(_summarise_sbom, tasks, chunksize=4):
+                portfolio.merge(summary)
+    return portfolio
+
+
+def _count_table(report, title, counts):
+    if len(counts) == 0:
+        return 0
+    report.heading(1, f"{title} Summary")
+    report.createtable([title, "Count"], [25, 6])
+    for key, value in counts:
+        report.addrow([key, str(value)])
+    report.showtable(widths=[10, 4])
+    return len(counts)
+
+
+def build_portfolio_report(portfolio, profiler, sections=None):
+    if sections is None:
+        sections = SECTIONS
+    sbom_count = len(portfolio.sboms)
+    report = Report()
+
+    if "summary" in sections:
+        with profiler.phase("summary") as phase:
+            report.heading(1, "Portfolio Summary")
+            report.createtable(["Item", "Details"], [20, 35])
+            report.addrow(["SBOMs", str(sbom_count)])
+            report.addrow(["Failed SBOMs", str(len(portfolio.failed))])
+            report.addrow(["Files", str(portfolio.file_count)])
+            report.addrow(["Packages", str(portfolio.package_count)])
+            report.addrow(["Distinct packages", str(len(portfolio.packages))])
+            report.addrow(["Relationships", str(portfolio.relationship_count)])
+            report.addrow(["NTIA conformant SBOMs", str(portfolio.conformant)])
+            report.showtable(widths=[5, 9])
+
+            phase["rows"] = 7
+
+            if sbom_count > 0:
+                report.heading(1, "SBOM Summary")
+                report.addtable(
+                    [
+                        "SBOM",
+                        "Name",
+                        "Type",
+                        "Packages",
+                        "Files",
+                        "Relationships",
+                        "NTIA Conformant",
+                    ],
+                    portfolio.sboms,
+                    widths=[5, 3, 2, 2, 2, 2, 2],
+                )
+                phase["rows"] += sbom_count
+
+            if len(portfolio.failed) > 0:
+                report.heading(1, "Failed SBOMs")
+                report.addtable(
+                    ["SBOM", "Error"],
+                    [list(failure) for failure in portfolio.failed],
+                    widths=[5, 9],
+                )
+                phase["rows"] += len(portfolio.failed)
+
+    if "packages" in sections and len(portfolio.packages) > 0:
+        with profiler.phase("packages") as phase:
+            report.heading(1, "Most Used Packages")
+            report.createtable(["Name", "Version", "PURL", "SBOMs"], [12, 8, 12, 6])
+            for key, count in portfolio.most_used():
+                record = portfolio.packages[key]
+                report.addrow([record.name, record.version, record.purl, str(count)])
+            report.showtable(widths=[4, 2, 5, 2])
+
+            report.heading(1, "Package Summary")
+            report.addtable(
+                ["Name", "Version", "PURL", "Type", "Supplier", "License", "SBOMs"],
+                [
+                    [
+                        record.name,
+                        record.version,
+                        record.purl,
+                        record.type,
+                        record.supplier,
+                        record.license,
+                        str(portfolio.usage[key]),
+                    ]
+                    for key, record in sorted(portfolio.packages.items())
+                ],
+                [12, 8, 12, 8, 12, 12],
+                widths=[4, 2, 4, 2, 3, 3, 2],
+            )
+            phase["rows"] = len(portfolio.packages)
+
+    for section, title, summary in [
+        ("components", "Component Type", portfolio.summary.component_summary),
+        ("licenses", "License", portfolio.summary.license_summary),
+        ("suppliers", "Supplier", portfolio.summary.supplier_summary),
+    ]:
+        if section in sections:
+            with profiler.phase(f"{section}_summary") as phase:
+                phase["rows"] = _count_table(report, title, summary())
+
+    if "ntia" in sections and sbom_count > 0:
+        with profiler.phase("ntia") as phase:
+            report.heading(1, "NTIA Summary")
+            report.createtable(["Element", "SBOMs"])
+            for element, count in portfolio.ntia.items():
+                report.addrow([element, f"{count} of {sbom_count}"])
+                phase["rows"] += 1
+            report.showtable(widths=[10, 4])
+            report.paragraph(
+                f"NTIA conformant SBOMs {portfolio.conformant} of {sbom_count}"
+            )
+    return report
@@ -0,0 +1,105 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+from sbom2doc.version import VERSION
+
+
+def peak_memory():
+    # High water mark of the process in KB (None if not available)
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS
+    return usage // 1024 if sys.platform == "darwin" else usage
+
+
+class Profiler:
+    # Records the wall time, number of rows and peak memory of each phase of
+    # the document generation together with cache statistics and the time
+    # to build each section of the document.
+
+    def __init__(self, cprofile=None):
+        self.phases = []
+        self.sections = {}
+        self.caches = {}
+        self.start = time.perf_counter()
+        self.cprofile_file = cprofile
+        self.cprofiler = None
+        if cprofile is not None:
+            import cProfile
+
+            self.cprofiler = cProfile.Profile()
+            self.cprofiler.enable()
+
+    @contextmanager
+    def phase(self, name):
+        record = {"name": name, "rows": 0}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["time"] = round(time.perf_counter() - start, 6)
+            record["peak_memory_kb"] = peak_memory()
+            self.phases.append(record)
+
+    @contextmanager
+    def section(self, name):
+        # A section may consist of several phases
+        record = {"skipped": False}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["time"] = round(time.perf_counter() - start, 6)
+            self.sections[name] = record
+
+    def skip_section(self, name):
+        # Section which was not selected so has not been built
+        self.sections[name] = {"skipped": True, "time": 0.0}
+
+    def record_cache(self, name, hits, misses):
+        lookups = hits + misses
+        self.caches[name] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 4) if lookups > 0 else 0.0,
+        }
+
+    def phase_time(self, name):
+        return sum(phase["time"] for phase in self.phases if phase["name"] == name)
+
+    def report(self):
+        return {
+            "version": VERSION,
+            "total_time": round(time.perf_counter() - self.start, 6),
+            "peak_memory_kb": peak_memory(),
+            "phases": self.phases,
+            "sections": self.sections,
+            "caches": self.caches,
+        }
+
+    def stop(self):
+        if self.cprofiler is not None:
+            self.cprofiler.disable()
+            self.cprofiler.dump_stats(self.cprofile_file)
+            self.cprofiler = None
+
+    def write(self, filename):
+        self.stop()
+        report = json.dumps(self.report(), indent=2)
+        if filename == "-":
+            print(report)
+        else:
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(report + "\n")
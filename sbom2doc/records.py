@@ -0,0 +1,104 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import sys
+from functools import lru_cache
+
+from packageurl import PackageURL
+
+# Maximum number of distinct PURLs retained by the parsing cache
+PURL_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=PURL_CACHE_SIZE)
+def purl_ecosystem(purl):
+    try:
+        return sys.intern(PackageURL.from_string(purl).type)
+    except ValueError:
+        return "INVALID"
+
+
+def intern(value):
+    # Repeated values (suppliers, licenses, types) share a single string
+    return sys.intern(value) if type(value) is str else value
+
+
+class FileRecord:
+    __slots__ = ("name", "type", "license", "copyright")
+
+    def __init__(self, name, type, license, copyright):
+        self.name = name
+        self.type = type
+        self.license = license
+        self.copyright = copyright
+
+    def row(self):
+        return [self.name, self.type, self.license, self.copyright]
+
+
+class PackageRecord:
+    __slots__ = (
+        "name",
+        "version",
+        "purl",
+        "cpe",
+        "type",
+        "supplier",
+        "license",
+        "ecosystem",
+        "download",
+        "copyright",
+    )
+
+    def __init__(
+        self,
+        name,
+        version,
+        purl,
+        cpe,
+        type,
+        supplier,
+        license,
+        ecosystem,
+        download,
+        copyright,
+    ):
+        self.name = name
+        self.version = version
+        self.purl = purl
+        self.cpe = cpe
+        self.type = type
+        self.supplier = supplier
+        self.license = license
+        self.ecosystem = ecosystem
+        self.download = download
+        self.copyright = copyright
+
+    def row(self):
+        return [
+            self.name,
+            self.version,
+            self.purl,
+            self.cpe,
+            self.type,
+            self.supplier,
+            self.license,
+            self.ecosystem,
+            self.download,
+            self.copyright,
+        ]
+
+
+def external_references(package):
+    # Single pass over the external references to find the PURL and CPE
+    ecosystem = "-"
+    purl = cpe = ""
+    external_info = package.get("externalreference", None)
+    if external_info is not None:
+        for reference in external_info:
+            if reference[1] == "purl":
+                purl = reference[2]
+                ecosystem = purl_ecosystem(purl)
+            elif reference[1] in ("cpe22Type", "cpe23Type"):
+                cpe = reference[2]
+    return purl, cpe, ecosystem
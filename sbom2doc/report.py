@@ -0,0 +1,144 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import pickle
+import shutil
+import tempfile
+
+from sbom2doc.docbuilder.docbuilder import DocBuilder
+
+
+class Table:
+    __slots__ = ("header", "validate", "rows", "widths", "records")
+
+    def __init__(self, header, validate=None):
+        self.header = header
+        self.validate = validate
+        self.rows = []
+        self.widths = None
+        # Set if the rows are records which are converted to rows as they
+        # are rendered
+        self.records = False
+
+
+class SpooledRows:
+    # Rows of a table which are written to a temporary file rather than held
+    # in memory. The rows can be read any number of times, including by
+    # other processes.
+
+    def __init__(self, directory):
+        handle, self.filename = tempfile.mkstemp(dir=directory, suffix=".rows")
+        self.file = os.fdopen(handle, "wb")
+        self.count = 0
+
+    def append(self, row):
+        pickle.dump(row, self.file, pickle.HIGHEST_PROTOCOL)
+        self.count += 1
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        self.close()
+        with open(self.filename, "rb") as f:
+            # Each row is pickled separately so is loaded with a new memo
+            while True:
+                try:
+                    yield pickle.load(f)
+                except EOFError:
+                    return
+
+    def __getstate__(self):
+        self.close()
+        return {"filename": self.filename, "file": None, "count": self.count}
+
+
+class Report(DocBuilder):
+    # Document model built once from a SBOM and rendered to any number of
+    # document builders. Elements are headings, paragraphs, page breaks and
+    # tables in document order. A report contains no references to the
+    # parser so it can be passed to other processes. If spooled is set, the
+    # rows of every table are held in temporary files rather than in memory.
+
+    def __init__(self, spooled=False):
+        self.elements = []
+        self.table = None
+        self.directory = None
+        self.spooled = spooled
+
+    def heading(self, level, title, number=True):
+        self.elements.append(("heading", level, title, number))
+
+    def paragraph(self, text):
+        self.elements.append(("paragraph", text))
+
+    def createtable(self, header, validate=None):
+        self.table = Table(header, validate)
+        if self.spooled:
+            self.table.rows = self.spool()
+        self.elements.append(self.table)
+
+    def addrow(self, data):
+        self.table.rows.append(data)
+
+    def showtable(self, widths=None):
+        self.table.widths = widths
+        self.table = None
+
+    def pagebreak(self):
+        self.elements.append(("pagebreak",))
+
+    def addtable(self, header, rows, validate=None, widths=None, records=False):
+        # Add a table with all of its rows
+        table = Table(header, validate)
+        table.rows = rows
+        table.records = records
+        table.widths = widths
+        self.elements.append(table)
+
+    def spool(self):
+        # Rows for a table which are held in a temporary file until the
+        # report is closed
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="sbom2doc-")
+        return SpooledRows(self.directory)
+
+    def close(self):
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory = None
+
+    def sections(self):
+        # Titles of the top level headings
+        return [
+            element[2]
+            for element in self.elements
+            if not isinstance(element, Table)
+            and element[0] == "heading"
+            and element[1] == 1
+        ]
+
+    def rows(self):
+        return sum(
+            len(element.rows) for element in self.elements if isinstance(element, Table)
+        )
+
+    def render(self, builder):
+        for element in self.elements:
+            if isinstance(element, Table):
+                builder.createtable(element.header, element.validate)
+                if element.records:
+                    for record in element.rows:
+                        builder.addrow(record.row())
+                else:
+                    for row in element.rows:
+                        builder.addrow(row)
+                builder.showtable(widths=element.widths)
+            else:
+                getattr(builder, element[0])(*element[1:])
@@ -0,0 +1,146 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+
+from lib4sbom.version import VERSION as LIB4SBOM_VERSION
+
+from sbom2doc.licensecache import default_cache_dir
+from sbom2doc.version import VERSION
+
+RESULT_DIR = "documents"
+
+# Maximum size of cached documents in bytes
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+# Formats which are written to the console are not cached
+UNCACHED_FORMATS = ["console"]
+
+BLOCK_SIZE = 1024 * 1024
+
+
+def file_digest(filename):
+    digest = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def data_digest(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResultCache:
+    # Generated documents are stored in a directory of files named by a hash
+    # of the SBOM content and the options used to generate the document.
+    # Entries are written to a temporary file and renamed so that the cache
+    # can be shared by multiple processes. The modification time of an
+    # entry records when it was last used and the least recently used
+    # entries are removed when the cache exceeds its maximum size.
+
+    def __init__(self, cache_dir=None, max_size=DEFAULT_MAX_SIZE, enabled=True):
+        self.hits = 0
+        self.misses = 0
+        self.max_size = max_size
+        self.directory = None
+        if enabled:
+            self.directory = os.path.join(cache_dir or default_cache_dir(), RESULT_DIR)
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+            except OSError:
+                # Continue without a persistent cache
+                self.directory = None
+
+    def key(self, digest, format, include_license, filename, **options):
+        # The filename is included as it is reported in the document. The
+        # lib4sbom version is included as it determines the parsed content
+        parts = [
+            VERSION,
+            LIB4SBOM_VERSION,
+            digest,
+            format,
+            str(include_license),
+            filename,
+        ]
+        parts.extend(f"{name}={options[name]}" for name in sorted(options))
+        return data_digest("\0".join(parts).encode("utf-8"))
+
+    def cacheable(self, format, outfile):
+        return (
+            self.directory is not None
+            and format not in UNCACHED_FORMATS
+            and outfile != ""
+        )
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key)
+
+    def get(self, key, outfile):
+        # Copy cached document to outfile. Returns False if not cached.
+        if self.directory is None:
+            return False
+        entry = self._entry(key)
+        try:
+            shutil.copyfile(entry, outfile)
+            os.utime(entry)
+        except FileNotFoundError:
+            # Not cached or removed by another process
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def put(self, key, outfile):
+        if self.directory is None or not os.path.isfile(outfile):
+            return
+        temp_file = None
+        try:
+            handle, temp_file = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            os.close(handle)
+            shutil.copyfile(outfile, temp_file)
+            os.replace(temp_file, self._entry(key))
+        except OSError:
+            if temp_file is not None and os.path.exists(temp_file):
+                os.remove(temp_file)
+            return
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        size = 0
+        for entry in os.scandir(self.directory):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            if entry.name.endswith(".tmp"):
+                # Remove files left by interrupted writes
+                if stat.st_mtime < time.time() - 3600:
+                    self._remove(entry.path)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            size += stat.st_size
+        if size <= self.max_size:
+            return
+        # Remove least recently used entries
+        for _, entry_size, path in sorted(entries):
+            self._remove(path)
+            size -= entry_size
+            if size <= self.max_size:
+                break
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            # Already removed by another process
+            pass
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups > 0 else 0.0
@@ -0,0 +1,169 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from lib4sbom.exception import SBOMParserException
+
+import sbom2doc.docbuilder.registry as registry
+import sbom2doc.generator as generator
+from sbom2doc.ingest import SBOMInputParser
+from sbom2doc.licensecache import LicenseCache
+from sbom2doc.resultcache import ResultCache, data_digest
+
+# Documents are generated by POSTing the SBOM to /document e.g.
+#
+#   curl --data-binary @flask.spdx "http://127.0.0.1:8080/document?format=html"
+#
+# Query parameters are format (default markdown), include_license and
+# filename (used for the 'SBOM File' entry in the document).
+
+CONTENT_TYPE = {
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "html": "text/html; charset=utf-8",
+    "json": "application/json",
+    "json-columnar": "application/json",
+    "markdown": "text/markdown; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "pdf": "application/pdf",
+}
+
+# Maximum time (seconds) a request waits for a worker
+QUEUE_TIMEOUT = 30
+
+MAX_SBOM_SIZE = 512 * 1024 * 1024
+
+
+class DocumentServer(ThreadingHTTPServer):
+    # State which is kept warm between requests
+    daemon_threads = True
+
+    def __init__(self, address, workers=4, cache_dir="", use_cache=True):
+        super().__init__(address, DocumentHandler)
+        self.workers = threading.BoundedSemaphore(workers)
+        self.license_cache = LicenseCache(cache_dir=cache_dir, enabled=use_cache)
+        self.result_cache = ResultCache(cache_dir=cache_dir, enabled=use_cache)
+        self.lock = threading.Lock()
+        self.requests = 0
+        # Import all builders at startup rather than on the first request
+        for format in registry.get_formats():
+            registry.get_builder(format)
+
+    def generate(self, data, format, include_license, filename):
+        key = self.result_cache.key(
+            data_digest(data), format, include_license, filename
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            outfile = os.path.join(directory, "document")
+            if not self.result_cache.get(key, outfile):
+                sbom_parser = SBOMInputParser()
+                sbom_parser.parse_string(data.decode("utf-8", errors="replace"))
+                generator.generate_document(
+                    format,
+                    sbom_parser,
+                    filename,
+                    outfile,
+                    include_license,
+                    license_cache=self.license_cache,
+                )
+                self.result_cache.put(key, outfile)
+            with open(outfile, "rb") as f:
+                return f.read()
+
+    def server_close(self):
+        super().server_close()
+        self.license_cache.close()
+
+
+class DocumentHandler(BaseHTTPRequestHandler):
+    server_version = "sbom2doc"
+
+    def log_message(self, format, *args):
+        # Requests are not logged
+        pass
+
+    def _respond(self, status, body, content_type="application/json"):
+        if isinstance(body, dict):
+            body = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if urlparse(self.path).path == "/health":
+            self._respond(200, {"status": "ok", "requests": self.server.requests})
+        else:
+            self._respond(404, {"error": "not found"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/document":
+            self._respond(404, {"error": "not found"})
+            return
+        query = parse_qs(url.query)
+        format = query.get("format", ["markdown"])[0]
+        include_license = query.get("include_license", ["false"])[0].lower() in [
+            "1",
+            "true",
+            "yes",
+        ]
+        filename = query.get("filename", ["-"])[0]
+        if format == "console" or not registry.is_format(format):
+            self._respond(400, {"error": f"unsupported format {format}"})
+            return
+        length = int(self.headers.get("Content-Length", 0))
+        if length == 0 or length > MAX_SBOM_SIZE:
+            self._respond(400, {"error": "invalid SBOM size"})
+            return
+        sbom = self.rfile.read(length)
+        # Limit the number of documents generated concurrently
+        if not self.server.workers.acquire(timeout=QUEUE_TIMEOUT):
+            self._respond(503, {"error": "server busy"})
+            return
+        start = time.perf_counter()
+        try:
+            document = self.server.generate(sbom, format, include_license, filename)
+        except SBOMParserException:
+            self._respond(422, {"error": "unable to parse SBOM"})
+            return
+        except Exception as e:
+            self._respond(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        finally:
+            self.server.workers.release()
+            with self.server.lock:
+                self.server.requests += 1
+        self.send_response(200)
+        self.send_header(
+            "Content-Type", CONTENT_TYPE.get(format, "application/octet-stream")
+        )
+        self.send_header("Content-Length", str(len(document)))
+        self.send_header("X-Generation-Time", f"{time.perf_counter() - start:.6f}")
+        self.end_headers()
+        self.wfile.write(document)
+
+
+def serve(address, workers=4, cache_dir="", use_cache=True):
+    host, _, port = address.rpartition(":")
+    server = DocumentServer(
+        (host or "127.0.0.1", int(port)),
+        workers=workers,
+        cache_dir=cache_dir,
+        use_cache=use_cache,
+    )
+    print(f"Serving SBOM documents on http://{host or '127.0.0.1'}:{port}/document")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
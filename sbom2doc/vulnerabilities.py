@@ -0,0 +1,82 @@
+# Copyright (C) 2026 Anthony Harrison
+# SPDX-License-Identifier: Apache-2.0
+
+import heapq
+from collections import Counter
+
+from sbom2doc.records import external_references, intern
+
+# Order in which severities are reported. Other severities follow in
+# alphabetical order.
+SEVERITY_ORDER = ["critical", "high", "medium", "low", "info", "none", "unknown"]
+
+
+class VulnerabilityIndex:
+    # Joins vulnerabilities to the affected packages. Packages are indexed by
+    # each of their references (id, bom-ref and PURL) and the vulnerabilities
+    # are counted by reference so the join is linear in the number of
+    # packages and vulnerabilities. Packages and vulnerabilities can be
+    # added in any order.
+
+    def __init__(self, packages=(), vulnerabilities=()):
+        self.packages = {}
+        self.severities = Counter()
+        self.statuses = Counter()
+        self.references = Counter()
+        self.count = 0
+        self.affected = Counter()
+        self.unmatched = 0
+        for package in packages:
+            self.add_package(package)
+        for vulnerability in vulnerabilities:
+            self.add_vulnerability(vulnerability)
+        self.analyse()
+
+    def add_package(self, package):
+        label = (package.get("name") or "", package.get("version") or "")
+        for key in ("id", "bom-ref"):
+            if package.get(key) is not None:
+                self.packages[package[key]] = label
+        purl = external_references(package)[0]
+        if purl != "":
+            self.packages[purl] = label
+
+    def add_vulnerability(self, vulnerability):
+        self.count += 1
+        self.severities[intern(vulnerability.get("severity") or "NOT KNOWN")] += 1
+        self.statuses[intern(vulnerability.get("status") or "NOT KNOWN")] += 1
+        # Reference of the affected package
+        reference = vulnerability.get("bom_link")
+        if reference is not None:
+            self.references[reference] += 1
+
+    def analyse(self):
+        # Called once all packages and vulnerabilities have been added. A
+        # package may be referenced by more than one of its references.
+        self.affected = Counter()
+        for reference, count in self.references.items():
+            label = self.packages.get(reference)
+            if label is not None:
+                self.affected[label] += count
+        # Vulnerabilities which do not refer to a package in the SBOM
+        self.unmatched = self.count - sum(self.affected.values())
+
+    def severity_summary(self):
+        def key(item):
+            severity = item[0].lower()
+            if severity in SEVERITY_ORDER:
+                return (SEVERITY_ORDER.index(severity), "")
+            return (len(SEVERITY_ORDER), severity)
+
+        return sorted(self.severities.items(), key=key)
+
+    def status_summary(self):
+        return sorted(self.statuses.items())
+
+    def most_affected(self, count=10):
+        # Packages with the most vulnerabilities
+        return heapq.nsmallest(
+            count,
+            self.affected.items(),
+            key=lambda item: (-item[1], item[0]),
+        )
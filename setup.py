@@ -25,6 +25,12 @@ setup_kwargs = dict(
     license='Apache-2.0',
     keywords=["documentation", "tools", "SBOM", "DevSecOps", "SPDX", "CycloneDX"],
     install_requires=requirements,
+    extras_require={
+        # Faster serialisation of the json-columnar and ndjson formats
+        "orjson": ["orjson"],
+        # Reading zstandard compressed SBOMs
+        "zstandard": ["zstandard"],
+    },
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',